@@ -0,0 +1,89 @@
+"""
+Overhead of qualified calls into a Module's Functions, by calling convention - run with:
+
+    python -m benchmarks.call_overhead [--max-calls N]
+
+'specialized' code objects take their arguments as they are, 'packed' ones take an args
+tuple and a keyword args tuple - built for every call - as Function.FnCodeObject used to.
+The calls with keywords pass a keyword list, which only the packed convention converts
+"""
+import argparse
+import time
+import typing
+
+from compiler.driver import Compiler
+from fluorite import runtime
+from fluorite.atom import Atom
+from fluorite.function import Function
+from fluorite.module import Module
+
+
+_MODULE = Atom('Bench')
+_SYMBOL = Atom('f')
+
+# label -> (the call, its arity, whether it passes keywords)
+_CALLS = {
+    'arity 0':    ("Bench.f()",            0, False),
+    'arity 1':    ("Bench.f(x)",           1, False),
+    'arity 3':    ("Bench.f(x, x, x)",     3, False),
+    'keywords':   ("Bench.f(x, k: x)",     2, True),
+}
+
+# arity -> the specialized code object called - and the packed one, for any arity
+_SPECIALIZED = {0: lambda: 0, 1: lambda a: a, 2: lambda a, kws: a, 3: lambda a, b, c: a}
+_PACKED = lambda args, kws: args[0] if args else 0
+
+
+def source_of(call: str, n_calls: int) -> str:
+    return "do\n  x = 1\n" + f"  {call}\n" * n_calls + "  x\nend\n"
+
+
+def module_of(convention: str, arity: int, keywords: bool) -> Module:
+    if convention == 'specialized':
+        fn = Function(_SYMBOL, _SPECIALIZED[arity], module=_MODULE, arity=arity)
+    else:
+        fn = Function.packed(_SYMBOL, _PACKED, module=_MODULE, arity=arity, keywords=keywords)
+
+    return Module(_MODULE, [fn])
+
+
+def run(sizes: typing.Iterable[int], repeat: int = 10):
+    fl_compiler = Compiler()
+
+    print(f"{'calls':>8} {'call':>10} {'convention':>12} {'ns/call':>8}")
+    for size in sizes:
+        for (label, (call, arity, keywords)) in _CALLS.items():
+            code = fl_compiler.compile(source_of(call, size))
+
+            for convention in ('packed', 'specialized'):
+                runtime.register_module(_MODULE.name, module_of(convention, arity, keywords))
+
+                _globals: typing.Dict[str, typing.Any] = {}
+                exec(code, _globals)            # ...links the calls
+
+                best = float('inf')
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    exec(code, _globals)
+                    best = min(best, time.perf_counter() - start)
+
+                print(f"{size:>8} {label:>10} {convention:>12} {best / size * 1e9:>8.0f}")
+
+
+def main():
+    argp = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argp.add_argument('--max-calls', type=int, default=100_000)
+
+    args = argp.parse_args()
+
+    sizes = []
+    size = 1_000
+    while size <= args.max_calls:
+        sizes.append(size)
+        size *= 10
+
+    run(sizes)
+
+
+if __name__ == '__main__':
+    main()
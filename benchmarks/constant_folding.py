@@ -0,0 +1,100 @@
+"""
+Bytecodes run, and time taken, by code compiled with and without IRTransformer's
+constant folding and arithmetic simplification - run with:
+
+    python -m benchmarks.constant_folding [--max-lines N]
+
+CPython folds arithmetic over literals by itself, so the gains come from what it
+can't see through: identities (x*1, x+0...) and literals in do blocks.
+
+Before timing anything, checks the optimizations keep what the code does - down to
+the errors it raises
+"""
+import argparse
+import dis
+import time
+import types
+import typing
+
+from compiler.driver import Compiler
+
+
+_LINE = "y = x * 1 + 0\nz = (do\n  2 * 3\nend) * 4 - 0\nw = 1 * (y + z * 1) + (0 + -(-5))\n"
+
+# source -> the exception running it raises
+_RAISING = {
+    "x = do\n  1/0\n  2\nend\n":            ZeroDivisionError,
+    "y = 0\nx = do\n  1/y\n  2\nend\n":     ZeroDivisionError,
+}
+
+
+def source_of(n_lines: int) -> str:
+    return "x = 7\n" + _LINE * (n_lines // _LINE.count('\n'))
+
+
+def bytecodes(code) -> int:
+    """
+    :return: the bytecodes of 'code', and of the functions it defines
+    """
+    own = sum(1 for instr in dis.get_instructions(code) if instr.opname != 'CACHE')
+
+    return own + sum(bytecodes(const) for const in code.co_consts if isinstance(const, types.CodeType))
+
+
+def check(compilers: typing.Dict[str, Compiler]):
+    for (source, exc_type) in _RAISING.items():
+        for (name, fl_compiler) in compilers.items():
+            try:
+                exec(fl_compiler.compile(source), {})
+            except exc_type:
+                continue
+
+            raise AssertionError(f"{name}: {source!r} doesn't raise {exc_type.__name__}")
+
+    results = set()
+    for fl_compiler in compilers.values():
+        namespace: typing.Dict[str, typing.Any] = {}
+        exec(fl_compiler.compile(source_of(_LINE.count('\n'))), namespace)
+
+        results.add(tuple(namespace[var] for var in 'xyzw'))
+
+    assert len(results) == 1, f"the compilers disagree: {results}"
+
+
+def run(sizes: typing.Iterable[int], repeat: int = 20):
+    compilers = {'plain': Compiler(optimize=False), 'folded': Compiler(optimize=True)}
+    check(compilers)
+
+    print(f"{'lines':>8} {'compiler':>9} {'bytecodes':>10} {'run (ms)':>9}")
+    for size in sizes:
+        source = source_of(size)
+
+        for (name, fl_compiler) in compilers.items():
+            code = fl_compiler.compile(source)
+
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                exec(code, {})
+                best = min(best, time.perf_counter() - start)
+
+            print(f"{size:>8} {name:>9} {bytecodes(code):>10} {best*1e3:>9.2f}")
+
+
+def main():
+    argp = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argp.add_argument('--max-lines', type=int, default=100_000)
+
+    args = argp.parse_args()
+
+    sizes = []
+    size = 1_000
+    while size <= args.max_lines:
+        sizes.append(size)
+        size *= 10
+
+    run(sizes)
+
+
+if __name__ == '__main__':
+    main()
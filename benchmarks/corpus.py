@@ -0,0 +1,55 @@
+"""
+Synthetic Fluorite programs, each stressing one shape of source - generated for a size,
+roughly the number of items (list elements, operands, calls, blocks...) they're made of.
+
+The deep shapes (nested do blocks, fn application chains, binary operators) repeat units
+of a bounded depth: the compiler's passes recurse over the trees, so their depth is bound
+by Python's recursion limit - and it's the cost per item that matters here
+"""
+import typing
+
+
+NESTING_DEPTH = 32
+CHAIN_LENGTH = 16
+OPERANDS = 64
+
+
+def nested_do(size: int) -> str:
+    block = 'x = ' + 'do\n' * NESTING_DEPTH + '1' + '\nend' * NESTING_DEPTH + '\n'
+
+    return block * max(1, size // NESTING_DEPTH)
+
+
+def long_list(size: int) -> str:
+    return 'x = [' + ', '.join(f"a{i}" for i in range(size)) + ']\n'
+
+
+def long_keyword_list(size: int) -> str:
+    return 'x = [' + ', '.join(f"k{i}: {i}" for i in range(size)) + ']\n'
+
+
+def fn_chains(size: int) -> str:
+    chain = ' '.join(f"f{i}" for i in range(CHAIN_LENGTH)) + ' x\n'     # f0(f1(...(x)))
+
+    return chain * max(1, size // CHAIN_LENGTH)
+
+
+def qualified_calls(size: int) -> str:
+    return ''.join(f"Mod.Sub.f{i % 7}(x, Math.sqrt(y{i}))\n" for i in range(max(1, size // 2)))
+
+
+def binary_ops(size: int) -> str:
+    ops = ('+', '-', '*', '/')
+    line = 'x = a0' + ''.join(f" {ops[i % len(ops)]} a{i}" for i in range(1, OPERANDS)) + '\n'
+
+    return line * max(1, size // OPERANDS)
+
+
+CORPORA: typing.Dict[str, typing.Callable[[int], str]] = {
+    'nested-do':       nested_do,
+    'list':            long_list,
+    'keyword-list':    long_keyword_list,
+    'fn-chains':       fn_chains,
+    'qualified-calls': qualified_calls,
+    'binary-ops':      binary_ops,
+}
@@ -0,0 +1,69 @@
+"""
+rply vs. combined-regex Lexer backends on large inputs - run with:
+
+    python -m benchmarks.lexer_backends [--max-tokens N]
+
+Both backends lex the same sources, and their outputs are checked to be
+identical (tags, values and source positions)
+"""
+import argparse
+import time
+import typing
+
+import compiler
+
+from .lexer_scaling import source_of
+
+
+def _lex_all(lexer: compiler.lexer.Lexer, source: str) -> typing.Tuple[float, list]:
+    start = time.perf_counter()
+    tokens = list(lexer.lex(source))
+
+    return (time.perf_counter() - start, tokens)
+
+
+def _position(tok) -> typing.Optional[typing.Tuple[int, int, int]]:
+    pos = tok.getsourcepos()
+
+    return (pos.idx, pos.lineno, pos.colno) if pos is not None else None
+
+
+def _signature(tokens: list) -> list:
+    return [(tok.gettokentype(), tok.getstr(), _position(tok)) for tok in tokens]
+
+
+def run(sizes: typing.Iterable[int]):
+    lexers = {backend: compiler.lexer.Lexer(backend) for backend in compiler.lexer.Lexer.BACKENDS}
+
+    print(f"{'tokens':>10} " + ' '.join(f"{backend + ' (s)':>12}" for backend in lexers) + f" {'speedup':>8}")
+    for size in sizes:
+        source = source_of(size)
+
+        results = {backend: _lex_all(lexer, source) for (backend, lexer) in lexers.items()}
+
+        (rply_time, rply_toks) = results[compiler.lexer.Lexer.RPLY]
+        (regex_time, regex_toks) = results[compiler.lexer.Lexer.REGEX]
+
+        assert _signature(rply_toks) == _signature(regex_toks), 'Lexer backends disagree!'
+
+        print(f"{len(rply_toks):>10} " + ' '.join(f"{t:>12.3f}" for (t, _) in results.values())
+              + f" {rply_time/regex_time:>7.1f}x")
+
+
+def main():
+    argp = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argp.add_argument('--max-tokens', type=int, default=1_000_000)
+
+    args = argp.parse_args()
+
+    sizes = []
+    size = 1_000
+    while size <= args.max_tokens:
+        sizes.append(size)
+        size *= 10
+
+    run(sizes)
+
+
+if __name__ == '__main__':
+    main()
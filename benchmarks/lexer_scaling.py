@@ -0,0 +1,60 @@
+"""
+Lexer.lex() time versus source size - run with:
+
+    python -m benchmarks.lexer_scaling [--max-tokens N]
+
+A linear lexer keeps the 'us/tok' column flat as the source grows
+"""
+import argparse
+import time
+import typing
+
+import compiler
+
+
+# A few lines of a typical program
+_LINE = "x = a * b + {c, 1}   # hypot\nMath.sqrt(x, [d, :ok])\nf a\n"
+
+
+def source_of(n_tokens: int) -> str:
+    tokens_per_line = sum(1 for _ in compiler.lexer.Lexer().lex(_LINE + "x")) - 1
+
+    return _LINE * max(1, n_tokens // tokens_per_line)
+
+
+def run(sizes: typing.Iterable[int]):
+    lexer = compiler.lexer.Lexer()
+
+    print(f"{'tokens':>10} {'chars':>10} {'first tok (ms)':>15} {'total (s)':>10} {'us/tok':>8}")
+    for size in sizes:
+        source = source_of(size)
+
+        start = time.perf_counter()
+        stream = lexer.lex(source)
+
+        next(stream)
+        first = time.perf_counter() - start
+
+        n_tokens = 1 + sum(1 for _ in stream)
+        total = time.perf_counter() - start
+
+        print(f"{n_tokens:>10} {len(source):>10} {first*1e3:>15.3f} {total:>10.3f} {total/n_tokens*1e6:>8.2f}")
+
+
+def main():
+    argp = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argp.add_argument('--max-tokens', type=int, default=1_000_000)
+
+    args = argp.parse_args()
+
+    sizes = []
+    size = 1_000
+    while size <= args.max_tokens:
+        sizes.append(size)
+        size *= 10
+
+    run(sizes)
+
+
+if __name__ == '__main__':
+    main()
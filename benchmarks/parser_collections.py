@@ -0,0 +1,57 @@
+"""
+Parse time of large collection literals and do-blocks - run with:
+
+    python -m benchmarks.parser_collections [--max-items N]
+
+Parsing should be linear in the number of items, i.e. the 'us/item' column
+should stay (roughly) flat as the literals grow
+"""
+import argparse
+import time
+import typing
+
+import compiler
+
+
+LITERALS: typing.Dict[str, typing.Callable[[int], str]] = {
+    'list':         lambda n: '[' + ', '.join(f"a{i}" for i in range(n)) + ']',
+    'tuple':        lambda n: '{' + ', '.join(str(i) for i in range(n)) + '}',
+    'keyword-list': lambda n: '[' + ', '.join(f"k{i}: {i}" for i in range(n)) + ']',
+    'do-block':     lambda n: 'do\n' + ''.join(f"  x{i} = {i}\n" for i in range(n)) + 'end',
+    'fn-args':      lambda n: 'f(' + ', '.join(f"a{i}" for i in range(n)) + ')',
+}
+
+
+def run(sizes: typing.Iterable[int]):
+    lexer = compiler.lexer.Lexer(compiler.lexer.Lexer.REGEX)
+    parser = compiler.parser.Parser()
+
+    print(f"{'literal':>14} {'items':>8} {'parse (s)':>10} {'us/item':>8}")
+    for (name, make_source) in LITERALS.items():
+        for size in sizes:
+            tokens = lexer.tokenize(make_source(size))
+
+            start = time.perf_counter()
+            parser.parse(tokens)
+            elapsed = time.perf_counter() - start
+
+            print(f"{name:>14} {size:>8} {elapsed:>10.3f} {elapsed/size*1e6:>8.2f}")
+
+
+def main():
+    argp = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argp.add_argument('--max-items', type=int, default=100_000)
+
+    args = argp.parse_args()
+
+    sizes = []
+    size = 1_000
+    while size <= args.max_items:
+        sizes.append(size)
+        size *= 10
+
+    run(sizes)
+
+
+if __name__ == '__main__':
+    main()
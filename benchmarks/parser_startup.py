@@ -0,0 +1,72 @@
+"""
+Parser() construction time, by where the parse tables come from - run with:
+
+    python -m benchmarks.parser_startup [--runs N]
+
+'frozen' loads compiler/_parsetab.py, 'cache (cold)' starts every run with
+an empty parse table cache, 'cache (warm)' reuses the tables cached by the
+first run. Each run is a fresh interpreter, so the figures include the
+import of the 'compiler' package (and, unless PYTHONDONTWRITEBYTECODE is
+set, hit the .pyc of _parsetab)
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import statistics
+
+
+_CONSTRUCT = """
+import sys
+import time
+
+if {no_frozen}:
+    sys.modules['compiler._parsetab'] = None     # makes 'from . import _parsetab' fail
+
+start = time.perf_counter()
+
+import compiler
+compiler.parser.Parser()
+
+print(time.perf_counter() - start)
+"""
+
+
+def time_construction(cache_dir: str, frozen: bool) -> float:
+    env = dict(os.environ, FLUORITE_CACHE_DIR=cache_dir)
+    code = _CONSTRUCT.format(no_frozen=not frozen)
+
+    out = subprocess.run([sys.executable, '-W', 'ignore', '-c', code],
+                         env=env, check=True, capture_output=True, text=True)
+
+    return float(out.stdout)
+
+
+def run(runs: int):
+    with tempfile.TemporaryDirectory() as cache_dir:
+        frozen = [time_construction(cache_dir, frozen=True) for _ in range(runs)]
+
+    cold = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold.append(time_construction(cache_dir, frozen=False))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        time_construction(cache_dir, frozen=False)        # populate the cache...
+
+        warm = [time_construction(cache_dir, frozen=False) for _ in range(runs)]
+
+    for (name, times) in (('frozen', frozen), ('cache (cold)', cold), ('cache (warm)', warm)):
+        print(f"{name:>12}: median {statistics.median(times)*1e3:8.2f} ms   min {min(times)*1e3:8.2f} ms")
+
+
+def main():
+    argp = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argp.add_argument('--runs', type=int, default=10)
+
+    run(argp.parse_args().runs)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Peak memory of parsing a source file read into a str vs. mapped into memory - run with:
+
+    python -m benchmarks.source_input [--tokens N]
+
+tracemalloc only sees Python allocations, so the mapped file itself (which
+lives in the page cache) doesn't count against the 'mmap' run
+"""
+import argparse
+import os
+import pathlib
+import tempfile
+import time
+import tracemalloc
+
+import compiler
+
+from .lexer_scaling import source_of
+
+
+def measure(parser: compiler.parser.Parser, load):
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    tree = parser.parse(load()).tree
+
+    elapsed = time.perf_counter() - start
+    (held, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (tree, elapsed, held, peak)
+
+
+def run(n_tokens: int):
+    parser = compiler.parser.Parser()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = pathlib.Path(tmp_dir, 'bench.fl')
+        path.write_text(source_of(n_tokens))
+
+        print(f"source: {os.path.getsize(path)/2**20:.2f} MiB")
+        print(f"{'':>6} {'time (s)':>9} {'held (MiB)':>11} {'peak (MiB)':>11}")
+
+        for (name, load) in (('str', path.read_text), ('mmap', lambda: path)):
+            (tree, elapsed, held, peak) = measure(parser, load)
+
+            print(f"{name:>6} {elapsed:>9.3f} {held/2**20:>11.2f} {peak/2**20:>11.2f}")
+
+            del tree
+
+
+def main():
+    argp = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argp.add_argument('--tokens', type=int, default=1_000_000)
+
+    run(argp.parse_args().tokens)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""
+Compiler throughput over synthetic corpora, saved for comparing between commits - run with:
+
+    python -m benchmarks.suite [--max-size N] [--repeat N] [--save FILE] [--compare FILE [--tolerance F]]
+
+For each corpus (see benchmarks.corpus) and size, measures the lexer's tokens/s, the
+parser's nodes/s, the memory the parse allocates per node, and the whole compilation's
+time. --compare checks them against the results --save'd by an earlier run, and exits
+with 1 when any got worse by more than the tolerance - as a quadratic hot spot would.
+
+Before measuring anything, checks the sources the compiler must reject still are - with
+and without optimizations
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tracemalloc
+import typing
+
+import rply
+
+from compiler.driver import Compiler
+from compiler.errors import CompileError
+from compiler.instrument import FileProfile, Profiler
+
+from .corpus import CORPORA
+
+
+_Result = typing.Dict[str, typing.Any]
+
+# source -> the error compiling it raises
+REJECTED: typing.Dict[str, typing.Type[Exception]] = {
+    '':                   rply.ParsingError,
+    '# comment\n':        rply.ParsingError,
+
+    # ...no arithmetic in patterns - not even what the optimizer would simplify away
+    'a + 0 = 5\n':        CompileError,
+    '{a * 1} = {5}\n':    CompileError,
+}
+
+# metric -> whether higher is better
+METRICS = {
+    'lex_tokens_per_s':  True,
+    'parse_nodes_per_s': True,
+    'bytes_per_node':    False,
+    'compile_s':         False,
+}
+
+
+def check():
+    for optimize in (False, True):
+        fl_compiler = Compiler(optimize=optimize)
+
+        for (source, exc_type) in REJECTED.items():
+            try:
+                fl_compiler.compile(source)
+            except exc_type:
+                continue
+            except Exception as e:
+                raise AssertionError(f"{source!r} (optimize={optimize}) raised {type(e).__name__}, "
+                                     f"not {exc_type.__name__}") from e
+
+            raise AssertionError(f"{source!r} (optimize={optimize}) compiled - instead of raising "
+                                 f"{exc_type.__name__}")
+
+
+def measure(fl_compiler: Compiler, source: str, repeat: int) -> _Result:
+    profiles: typing.List[FileProfile] = []
+
+    for _ in range(repeat):
+        fl_compiler.compile(source)
+        profiles.extend(fl_compiler.profiler.take())
+
+    tracemalloc.start()
+    try:
+        fl_compiler.compile(source)
+    finally:
+        tracemalloc.stop()
+    (traced, ) = fl_compiler.profiler.take()
+
+    def phase(profile: FileProfile, name: str):
+        return next(stats for stats in profile.phases if stats.name == name)
+
+    lex = min((phase(profile, 'lex') for profile in profiles), key=lambda stats: stats.seconds)
+    parse = min((phase(profile, 'parse') for profile in profiles), key=lambda stats: stats.seconds)
+
+    return {
+        'tokens':            lex.items,
+        'nodes':             parse.items,
+        'lex_tokens_per_s':  lex.items / lex.seconds,
+        'parse_nodes_per_s': parse.items / parse.seconds,
+        'bytes_per_node':    phase(traced, 'parse').peak_bytes / parse.items,
+        'compile_s':         min(profile.seconds for profile in profiles),
+    }
+
+
+def run(sizes: typing.Iterable[int], repeat: int) -> typing.List[_Result]:
+    fl_compiler = Compiler(profiler=Profiler())
+    results = []
+
+    print(f"{'corpus':>16} {'size':>7} {'tokens':>8} {'tok/s':>10} {'nodes':>8} {'nodes/s':>10} "
+          f"{'B/node':>7} {'compile (s)':>12}")
+    for (name, make_source) in CORPORA.items():
+        for size in sizes:
+            result: _Result = {'corpus': name, 'size': size}
+
+            try:
+                result.update(measure(fl_compiler, make_source(size), repeat))
+            except RecursionError as e:
+                fl_compiler.profiler.take()
+                result['error'] = f"{type(e).__name__}: {e}"
+
+                print(f"{name:>16} {size:>7}  {result['error']}")
+            else:
+                print(f"{name:>16} {size:>7} {result['tokens']:>8} {result['lex_tokens_per_s']:>10.0f} "
+                      f"{result['nodes']:>8} {result['parse_nodes_per_s']:>10.0f} "
+                      f"{result['bytes_per_node']:>7.1f} {result['compile_s']:>12.4f}")
+
+            results.append(result)
+
+    return results
+
+
+def compare(results: typing.List[_Result], baseline: typing.List[_Result], tolerance: float) -> typing.List[str]:
+    """
+    :return: the regressions of 'results' against 'baseline' - for each corpus and size
+         both have, the metrics that got worse by more than 'tolerance' (a fraction), and
+         the compilations that newly fail
+    """
+    base = {(result['corpus'], result['size']): result for result in baseline}
+    regressions = []
+
+    for result in results:
+        before = base.get((result['corpus'], result['size']))
+        if before is None:
+            continue
+
+        where = f"{result['corpus']}/{result['size']}"
+
+        if 'error' in result:
+            if 'error' not in before:
+                regressions.append(f"{where}: now fails - {result['error']}")
+            continue
+
+        if 'error' in before:
+            continue
+
+        for (metric, higher_is_better) in METRICS.items():
+            (old, new) = (before[metric], result[metric])
+            change = (old - new) / old if higher_is_better else (new - old) / old
+
+            if change > tolerance:
+                regressions.append(f"{where}: {metric} {old:.4g} -> {new:.4g} ({change:+.0%} worse)")
+
+    return regressions
+
+
+def _commit() -> typing.Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    argp = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argp.add_argument('--max-size', type=int, default=10_000)
+    argp.add_argument('--repeat', type=int, default=3)
+    argp.add_argument('--save', metavar='FILE', help="write the results to FILE, as JSON")
+    argp.add_argument('--compare', metavar='FILE', help="check the results against those saved in FILE")
+    argp.add_argument('--tolerance', type=float, default=0.5,
+                      help="how much worse a metric may get before it's a regression (default: 0.5)")
+
+    args = argp.parse_args()
+
+    sizes = []
+    size = 1_000
+    while size <= args.max_size:
+        sizes.append(size)
+        size *= 10
+
+    check()
+    results = run(sizes, args.repeat)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'commit': _commit(), 'python': platform.python_version(), 'results': results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            saved = json.load(f)
+
+        regressions = compare(results, saved['results'], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        print(f"{len(regressions)} regressions against {args.compare} (commit {saved.get('commit')})")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
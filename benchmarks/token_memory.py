@@ -0,0 +1,49 @@
+"""
+Memory held by a lexed source: rply Tokens vs. a TokenBuffer - run with:
+
+    python -m benchmarks.token_memory [--tokens N]
+"""
+import argparse
+import time
+import tracemalloc
+
+import compiler
+
+from .lexer_scaling import source_of
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    result = fn(*args)
+
+    elapsed = time.perf_counter() - start
+    (held, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (result, elapsed, held, peak)
+
+
+def run(n_tokens: int):
+    lexer = compiler.lexer.Lexer(compiler.lexer.Lexer.REGEX)
+    source = source_of(n_tokens)
+
+    print(f"{'':>14} {'tokens':>10} {'time (s)':>9} {'held (MiB)':>11} {'peak (MiB)':>11} {'B/tok':>7}")
+    for (name, fn) in (('list(lex())', lambda src: list(lexer.lex(src))), ('tokenize()', lexer.tokenize)):
+        (tokens, elapsed, held, peak) = measure(fn, source)
+
+        print(f"{name:>14} {len(tokens):>10} {elapsed:>9.3f} {held/2**20:>11.2f} {peak/2**20:>11.2f} {held/len(tokens):>7.1f}")
+
+        del tokens
+
+
+def main():
+    argp = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argp.add_argument('--tokens', type=int, default=1_000_000)
+
+    run(argp.parse_args().tokens)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Memory held by a source tree: ast nodes vs. a TreeArena - run with:
+
+    python -m benchmarks.tree_memory [--size N]
+
+For each corpus (see benchmarks.corpus), the tree as the parser builds it, then as
+ParseTreesData.compact() keeps it - and the time both ways between the two
+"""
+import argparse
+import ast
+import time
+
+import compiler
+from compiler.arena import TreeArena
+
+from .corpus import CORPORA
+from .token_memory import measure
+
+
+def run(size: int):
+    lexer = compiler.lexer.Lexer(compiler.lexer.Lexer.REGEX)
+    parser = compiler.parser.Parser()
+
+    print(f"{'corpus':>16} {'nodes':>8} {'ast (KiB)':>10} {'arena (KiB)':>12} {'ratio':>6} "
+          f"{'to arena (s)':>13} {'to ast (s)':>11}")
+    for (name, make_source) in CORPORA.items():
+        tokens = lexer.tokenize(make_source(size))
+
+        (tree, _, tree_held, _) = measure(lambda: parser.parse(tokens).trees.source_tree)
+        (arena, _, arena_held, _) = measure(TreeArena.from_tree, tree)
+
+        # ...timed untraced, as tracemalloc slows down allocation a lot
+        start = time.perf_counter()
+        TreeArena.from_tree(tree)
+        to_arena = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rebuilt = arena.to_tree()
+        to_tree = time.perf_counter() - start
+
+        assert ast.dump(rebuilt, include_attributes=True) == ast.dump(tree, include_attributes=True)
+
+        print(f"{name:>16} {len(arena):>8} {tree_held/1024:>10.1f} {arena_held/1024:>12.1f} "
+              f"{tree_held/arena_held:>6.1f} {to_arena:>13.3f} {to_tree:>11.3f}")
+
+        del tree, arena, rebuilt
+
+
+def main():
+    argp = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argp.add_argument('--size', type=int, default=10_000)
+
+    run(argp.parse_args().size)
+
+
+if __name__ == '__main__':
+    main()
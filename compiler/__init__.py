@@ -1,16 +1,40 @@
 from compiler import        \
-    tree, lexer, parser,    \
+    tree, arena,            \
+    lexer, parser,          \
+    source,                 \
+    relexer, tokenbuf,      \
+    grammar, lrparser,      \
+    tablecache,             \
     codetransform, codegen, \
-    codeobj
+    symbol, codeobj,        \
+    errors,                 \
+    codecache, instrument,  \
+    driver,                 \
+    importer
+
+
+compile_source = driver.compile_source
 
 
 __all__ = [
-    tree.ParseTreesData,
+    tree.ParseTreesData, arena.TreeArena,
 
     lexer.Lexer, parser.Parser,
+    source.LineIndex,
+    relexer.RegexLexer,
+    tokenbuf.TokenBuffer, tokenbuf.TokenView,
+    grammar.Grammar,
+    lrparser.LRParser, lrparser.ParseTables,
+    tablecache.ParseTableCache,
     codetransform.IRTransformer,
     codegen.CodeGen,
+    errors.CompileError,
+    codecache.CodeCache,
+    instrument.Profiler,
+    driver.Compiler, driver.compile_source,
+    importer.FluoriteFinder, importer.FluoriteLoader,
 
     codeobj.CodeObject,
     codeobj.Symbol, codeobj.SymbolTable,
+    symbol.ScopeAnalyzer,
 ]
@@ -0,0 +1,60 @@
+"""
+The 'fluorite' command line:
+
+    python -m compiler build <dir> [-o <out-dir>] [-j <jobs>] [--profile [text|json]] [--no-cache]
+"""
+import argparse
+import sys
+import typing
+
+from . import build
+from .instrument import Profiler
+
+
+def build_command(args: argparse.Namespace) -> int:
+    result = build.build(args.dir, args.out_dir, jobs=args.jobs, cache_dir=args.cache_dir,
+                         use_cache=not args.no_cache, profile=args.profile is not None)
+
+    if args.profile == 'json':
+        print(Profiler.to_json(result.profiles))
+
+        return 1 if result.failed else 0
+
+    for file in result.files:
+        status = 'ok' if file.error is None else f"FAILED - {file.error}"
+        print(f"{file.seconds * 1e3:>9.1f} ms  {file.path}: {status}")
+
+    compiled = sum(file.seconds for file in result.files)
+    print(f"{len(result.files)} files, {len(result.failed)} failed - "
+          f"{result.seconds:.2f} s ({compiled:.2f} s compiling)")
+
+    if args.profile == 'text':
+        print()
+        print(Profiler.report(result.profiles))
+
+    return 1 if result.failed else 0
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    argp = argparse.ArgumentParser(prog='fluorite')
+    commands = argp.add_subparsers(dest='command', required=True)
+
+    build_argp = commands.add_parser('build', help=build.__doc__.strip().splitlines()[0])
+    build_argp.add_argument('dir', help="the directory holding the .fl sources")
+    build_argp.add_argument('-o', '--out-dir', default='build', help="where the .pyc files go (default: build)")
+    build_argp.add_argument('-j', '--jobs', type=int, default=None,
+                            help="worker processes (default: one per CPU)")
+    build_argp.add_argument('--cache-dir', default=None, help="the CodeCache's directory")
+    build_argp.add_argument('--no-cache', action='store_true', help="compile every file, cached or not")
+    build_argp.add_argument('--profile', nargs='?', const='text', choices=('text', 'json'), default=None,
+                            help="report each phase's time, output size and peak allocations, per file - "
+                                 "as a table, slowest first (the default), or as JSON")
+    build_argp.set_defaults(run=build_command)
+
+    args = argp.parse_args(argv)
+
+    return args.run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,366 @@
+# Generated by 'python -m compiler.parsergen' from the grammar in compiler/parser.py - DO NOT EDIT!
+
+GRAMMAR_HASH = '6f8634917dc3509a9da5b893ae71439b58d7f215'
+
+PRODUCTIONS = (
+    ("S'", 1),
+    ('main', 1),
+    ('exprs', 1),
+    ('exprs', 3),
+    ('exprs', 3),
+    ('expr-or-fn-apply', 1),
+    ('expr-or-fn-apply', 1),
+    ('expr-or-fn-apply', 1),
+    ('keyword', 2),
+    ('atom', 1),
+    ('id', 1),
+    ('number', 1),
+    ('expr', 1),
+    ('expr', 1),
+    ('literal', 1),
+    ('literal', 1),
+    ('literal', 1),
+    ('literal', 1),
+    ('literal', 1),
+    ('tuple', 4),
+    ('tuple', 3),
+    ('tuple', 3),
+    ('tuple', 2),
+    ('tuple-items', 1),
+    ('tuple-items', 3),
+    ('list', 3),
+    ('list', 2),
+    ('list-open', 2),
+    ('list-open', 1),
+    ('list-close', 2),
+    ('list-close', 2),
+    ('list-close', 1),
+    ('list-items', 1),
+    ('list-items', 3),
+    ('list-items', 4),
+    ('list-items', 3),
+    ('list-item', 1),
+    ('keyword-list', 3),
+    ('kw-list-open', 2),
+    ('kw-list-open', 1),
+    ('kw-list-close', 2),
+    ('kw-list-close', 2),
+    ('kw-list-close', 1),
+    ('keyword-list-items', 1),
+    ('keyword-list-items', 3),
+    ('keyword-list-items', 4),
+    ('keyword-list-items', 3),
+    ('keyword-list-item', 1),
+    ('fn-apply', 1),
+    ('fn-apply', 1),
+    ('fn-apply', 1),
+    ('fn-apply_parens', 5),
+    ('fn-apply_noparens', 3),
+    ('fn-apply0', 4),
+    ('fn-id', 1),
+    ('fn-id', 3),
+    ('fn-module', 1),
+    ('fn-module', 3),
+    ('fn-args', 1),
+    ('fn-args', 3),
+    ('fn-arg', 1),
+    ('fn-arg', 3),
+    ('fn-arg', 1),
+    ('expr', 1),
+    ('expr', 1),
+    ('do-block', 3),
+    ('do-block-open', 2),
+    ('do-block-close', 2),
+    ('expr', 3),
+    ('primary-expr', 3),
+    ('primary-expr', 3),
+    ('primary-expr', 3),
+    ('primary-expr', 3),
+    ('match-expr', 3),
+    ('expr', 1),
+    ('badd', 1),
+    ('bsub', 1),
+    ('bmult', 1),
+    ('bdiv', 1),
+    ('unary-expr', 2),
+    ('unary-op', 1),
+    ('unary-op', 1),
+    ('--synth-toks', 1),
+    ('--synth-toks', 3),
+    ('main', 1),
+)
+
+DEFAULT_REDUCTIONS = (0, 0, -80, -81, -9, 0, -10, 0, -11, -82, 0, 0, -84, 0, -64, 0, 0, -2, 0, -5,
+    -48, -50, -49, 0, 0, 0, -18, 0, -17, 0, -12, 0, -6, -14, -63, -16, -74, 0, -15, 0, -13, -66, 0,
+    0, -26, 0, -22, -23, 0, 0, -77, -75, -76, -78, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -47, -43, 0, -36,
+    -32, 0, -79, -68, -83, -21, 0, -20, 0, -65, 0, 0, -69, -70, 0, -3, -4, 0, -60, -58, 0, -62, -57,
+    -55, -8, 0, 0, -42, -37, 0, 0, -31, -25, -19, -24, -67, 0, -53, 0, 0, 0, 0, 0, 0, -46, -40, -41,
+    -44, 0, 0, -29, -35, -30, -33, 0, -61, -51, 0, -59, 0, -45, 0, -34)
+
+ACTION = (
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NOPARENSAPPLY': 7, 'NUM': 8, 'UNARYOP': 9, '[': 10, '{': 11},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'(': -80, '+': -80, '-': -80, 'ATOM': -80, 'DO': -80, 'ID': -80, 'NUM': -80, '[': -80, '{': -80},
+    {'(': -81, '+': -81, '-': -81, 'ATOM': -81, 'DO': -81, 'ID': -81, 'NUM': -81, '[': -81, '{': -81},
+    {'$end': -9, ')': -9, '*': -9, '+': -9, ',': -9, '-': -9, '.': -9, '/': -9, ';': -9, '=': -9, 'LF': -9, ']': -9, '}': -9},
+    {'LF': 41},
+    {'$end': -10, ')': -10, '*': -10, '+': -10, ',': -10, '-': -10, '/': -10, ';': -10, '=': -10, 'FNAPPLY': -10, 'LF': -10, ']': -10, '}': -10},
+    {'PARENSAPPLY': 42},
+    {'$end': -11, ')': -11, '*': -11, '+': -11, ',': -11, '-': -11, '/': -11, ';': -11, '=': -11, 'LF': -11, ']': -11, '}': -11},
+    {'$end': -82},
+    {'(': -28, '+': -28, '-': -28, 'ATOM': -28, 'DO': -28, 'ID': -28, 'KW': -39, 'LF': 43, 'NUM': -28, '[': -28, ']': 44, '{': -28},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'LF': 45, 'NUM': 8, '[': 10, '{': 11, '}': 46},
+    {'$end': -84},
+    {'$end': -15, ')': -15, '*': -15, '+': -15, ',': -15, '-': -15, '.': -56, '/': -15, ';': -15, '=': -15, 'LF': -15, ']': -15, '}': -15},
+    {'$end': -64, ')': -64, '*': -64, '+': -64, ',': -64, '-': -64, '/': -64, ';': -64, '=': -64, 'LF': -64, ']': -64, '}': -64},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'$end': -7, ')': -7, '*': 50, '+': 51, ',': -7, '-': 52, '/': 53, ';': -7, '=': 54, 'LF': -7, ']': -7, '}': -7},
+    {'$end': -2, ';': -2, 'LF': -2},
+    {'$end': -1, ';': 59, 'LF': 60},
+    {'$end': -5, ')': -5, ',': -5, ';': -5, 'LF': -5, ']': -5, '}': -5},
+    {'$end': -48, ')': -48, ',': -48, ';': -48, 'LF': -48, ']': -48, '}': -48},
+    {'$end': -50, ')': -50, ',': -50, ';': -50, 'LF': -50, ']': -50, '}': -50},
+    {'$end': -49, ')': -49, ',': -49, ';': -49, 'LF': -49, ']': -49, '}': -49},
+    {'FNAPPLY': 61},
+    {'.': 62},
+    {'$end': -13, ')': -13, '*': -13, '+': -13, ',': -13, '-': -13, '/': -13, ';': -13, '=': -13, 'FNAPPLY': -54, 'LF': -13, ']': -13, '}': -13},
+    {'$end': -18, ')': -18, '*': -18, '+': -18, ',': -18, '-': -18, '/': -18, ';': -18, '=': -18, 'LF': -18, ']': -18, '}': -18},
+    {'KW': 63},
+    {'$end': -17, ')': -17, '*': -17, '+': -17, ',': -17, '-': -17, '/': -17, ';': -17, '=': -17, 'LF': -17, ']': -17, '}': -17},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'$end': -12, ')': -12, '*': -12, '+': -12, ',': -12, '-': -12, '/': -12, ';': -12, '=': -12, 'LF': -12, ']': -12, '}': -12},
+    {'$end': 0},
+    {'$end': -6, ')': -6, ',': -6, ';': -6, 'LF': -6, ']': -6, '}': -6},
+    {'$end': -14, ')': -14, '*': -14, '+': -14, ',': -14, '-': -14, '/': -14, ';': -14, '=': -14, 'LF': -14, ']': -14, '}': -14},
+    {'$end': -63, ')': -63, '*': -63, '+': -63, ',': -63, '-': -63, '/': -63, ';': -63, '=': -63, 'LF': -63, ']': -63, '}': -63},
+    {'$end': -16, ')': -16, '*': -16, '+': -16, ',': -16, '-': -16, '/': -16, ';': -16, '=': -16, 'LF': -16, ']': -16, '}': -16},
+    {'$end': -74, ')': -74, '*': -74, '+': -74, ',': -74, '-': -74, '/': -74, ';': -74, '=': -74, 'LF': -74, ']': -74, '}': -74},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'$end': -15, ')': -15, '*': -15, '+': -15, ',': -15, '-': -15, '/': -15, ';': -15, '=': -15, 'LF': -15, ']': -15, '}': -15},
+    {')': 71, '*': 50, '+': 51, '-': 52, '/': 53},
+    {'$end': -13, ')': -13, '*': -13, '+': -13, ',': -13, '-': -13, '/': -13, ';': -13, '=': -13, 'LF': -13, ']': -13, '}': -13},
+    {'(': -66, '+': -66, '-': -66, 'ATOM': -66, 'DO': -66, 'ID': -66, 'NUM': -66, '[': -66, '{': -66},
+    {'UNARYAPPLY': 72},
+    {'(': -27, '+': -27, '-': -27, 'ATOM': -27, 'DO': -27, 'ID': -27, 'KW': -38, 'NUM': -27, '[': -27, '{': -27},
+    {'$end': -26, ')': -26, '*': -26, '+': -26, ',': -26, '-': -26, '/': -26, ';': -26, '=': -26, 'LF': -26, ']': -26, '}': -26},
+    {'}': 73},
+    {'$end': -22, ')': -22, '*': -22, '+': -22, ',': -22, '-': -22, '/': -22, ';': -22, '=': -22, 'LF': -22, ']': -22, '}': -22},
+    {',': -23, '}': -23},
+    {',': 74, '}': 75},
+    {';': 59, 'LF': 76},
+    {'(': -77, '+': -77, '-': -77, 'ATOM': -77, 'DO': -77, 'ID': -77, 'NUM': -77, '[': -77, '{': -77},
+    {'(': -75, '+': -75, '-': -75, 'ATOM': -75, 'DO': -75, 'ID': -75, 'NUM': -75, '[': -75, '{': -75},
+    {'(': -76, '+': -76, '-': -76, 'ATOM': -76, 'DO': -76, 'ID': -76, 'NUM': -76, '[': -76, '{': -76},
+    {'(': -78, '+': -78, '-': -78, 'ATOM': -78, 'DO': -78, 'ID': -78, 'NUM': -78, '[': -78, '{': -78},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'(': 85, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'KW': 63, 'NUM': 8, '[': 10, '{': 11},
+    {'ATOM': 4, 'ID': 6},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {',': -47, 'LF': -47, ']': -47},
+    {',': -43, 'LF': -43, ']': -43},
+    {',': 93, 'LF': 94, ']': 95},
+    {',': -36, 'LF': -36, ']': -36},
+    {',': -32, 'LF': -32, ']': -32},
+    {',': 97, 'LF': 98, ']': 99},
+    {'$end': -79, ')': -79, '*': -79, '+': -79, ',': -79, '-': -79, '/': -79, ';': -79, '=': -79, 'LF': -79, ']': -79, '}': -79},
+    {'$end': -68, ')': -68, '*': -68, '+': -68, ',': -68, '-': -68, '/': -68, ';': -68, '=': -68, 'LF': -68, ']': -68, '}': -68},
+    {'$end': -83},
+    {'$end': -21, ')': -21, '*': -21, '+': -21, ',': -21, '-': -21, '/': -21, ';': -21, '=': -21, 'LF': -21, ']': -21, '}': -21},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11, '}': 101},
+    {'$end': -20, ')': -20, '*': -20, '+': -20, ',': -20, '-': -20, '/': -20, ';': -20, '=': -20, 'LF': -20, ']': -20, '}': -20},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'END': 103, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'$end': -65, ')': -65, '*': -65, '+': -65, ',': -65, '-': -65, '/': -65, ';': -65, '=': -65, 'LF': -65, ']': -65, '}': -65},
+    {'$end': -73, ')': -73, '*': 50, '+': 51, ',': -73, '-': 52, '/': 53, ';': -73, 'LF': -73, ']': -73, '}': -73},
+    {'$end': -72, ')': -72, '*': 50, '+': -72, ',': -72, '-': -72, '/': 53, ';': -72, '=': -72, 'LF': -72, ']': -72, '}': -72},
+    {'$end': -69, ')': -69, '*': -69, '+': -69, ',': -69, '-': -69, '/': -69, ';': -69, '=': -69, 'LF': -69, ']': -69, '}': -69},
+    {'$end': -70, ')': -70, '*': -70, '+': -70, ',': -70, '-': -70, '/': -70, ';': -70, '=': -70, 'LF': -70, ']': -70, '}': -70},
+    {'$end': -71, ')': -71, '*': 50, '+': -71, ',': -71, '-': -71, '/': 53, ';': -71, '=': -71, 'LF': -71, ']': -71, '}': -71},
+    {'$end': -3, ';': -3, 'LF': -3},
+    {'$end': -4, ';': -4, 'LF': -4},
+    {'(': 104, ')': 105, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'KW': 63, 'NUM': 8, '[': 10, '{': 11},
+    {'$end': -60, ')': -60, ',': -60, ';': -60, 'LF': -60, ']': -60, '}': -60},
+    {'$end': -58, ')': -58, ',': -58, ';': -58, 'LF': -58, ']': -58, '}': -58},
+    {'$end': -52, ')': -52, ',': 109, ';': -52, 'LF': -52, ']': -52, '}': -52},
+    {'$end': -62, ')': -62, ',': -62, ';': -62, 'LF': -62, ']': -62, '}': -62},
+    {'.': -57},
+    {'FNAPPLY': -55},
+    {'$end': -8, ')': -8, ',': -8, ';': -8, 'LF': -8, ']': -8, '}': -8},
+    {',': 110, 'KW': 63, 'LF': 111, ']': 95},
+    {'KW': 63, ']': 114},
+    {'$end': -42, ')': -42, '*': -42, '+': -42, ',': -42, '-': -42, '/': -42, ';': -42, '=': -42, 'LF': -42, ']': -42, '}': -42},
+    {'$end': -37, ')': -37, '*': -37, '+': -37, ',': -37, '-': -37, '/': -37, ';': -37, '=': -37, 'LF': -37, ']': -37, '}': -37},
+    {'(': 1, '+': 2, ',': 116, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'LF': 117, 'NUM': 8, '[': 10, ']': 99, '{': 11},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, ']': 120, '{': 11},
+    {'$end': -31, ')': -31, '*': -31, '+': -31, ',': -31, '-': -31, '/': -31, ';': -31, '=': -31, 'LF': -31, ']': -31, '}': -31},
+    {'$end': -25, ')': -25, '*': -25, '+': -25, ',': -25, '-': -25, '/': -25, ';': -25, '=': -25, 'LF': -25, ']': -25, '}': -25},
+    {'$end': -19, ')': -19, '*': -19, '+': -19, ',': -19, '-': -19, '/': -19, ';': -19, '=': -19, 'LF': -19, ']': -19, '}': -19},
+    {',': -24, '}': -24},
+    {'$end': -67, ')': -67, '*': -67, '+': -67, ',': -67, '-': -67, '/': -67, ';': -67, '=': -67, 'LF': -67, ']': -67, '}': -67},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'$end': -53, ')': -53, ',': -53, ';': -53, 'LF': -53, ']': -53, '}': -53},
+    {')': 71, '*': 50, '+': 51, ',': -7, '-': 52, '/': 53, '=': 54},
+    {')': 123, ',': -5},
+    {')': 124, ',': 109},
+    {'(': 125, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'KW': 63, 'NUM': 8, '[': 10, '{': 11},
+    {',': 110, 'LF': 127, ']': 95},
+    {'KW': 63, ']': 114},
+    {',': -46, 'LF': -46, ']': -46},
+    {'$end': -40, ')': -40, '*': -40, '+': -40, ',': -40, '-': -40, '/': -40, ';': -40, '=': -40, 'LF': -40, ']': -40, '}': -40},
+    {'$end': -41, ')': -41, '*': -41, '+': -41, ',': -41, '-': -41, '/': -41, ';': -41, '=': -41, 'LF': -41, ']': -41, '}': -41},
+    {',': -44, 'LF': -44, ']': -44},
+    {',': 116, 'LF': 129, ']': 99},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, ']': 120, '{': 11},
+    {'$end': -29, ')': -29, '*': -29, '+': -29, ',': -29, '-': -29, '/': -29, ';': -29, '=': -29, 'LF': -29, ']': -29, '}': -29},
+    {',': -35, 'LF': -35, ']': -35},
+    {'$end': -30, ')': -30, '*': -30, '+': -30, ',': -30, '-': -30, '/': -30, ';': -30, '=': -30, 'LF': -30, ']': -30, '}': -30},
+    {',': -33, 'LF': -33, ']': -33},
+    {')': 123},
+    {'$end': -61, ')': -61, ',': -61, ';': -61, 'LF': -61, ']': -61, '}': -61},
+    {'$end': -51, ')': -51, ',': -51, ';': -51, 'LF': -51, ']': -51, '}': -51},
+    {'(': 1, '+': 2, '-': 3, 'ATOM': 4, 'DO': 5, 'ID': 6, 'NUM': 8, '[': 10, '{': 11},
+    {'$end': -59, ')': -59, ',': -59, ';': -59, 'LF': -59, ']': -59, '}': -59},
+    {']': 114},
+    {',': -45, 'LF': -45, ']': -45},
+    {']': 120},
+    {',': -34, 'LF': -34, ']': -34},
+)
+
+GOTO = (
+    {'--synth-toks': 12, 'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 17, 'exprs': 18, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'main': 31, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {'atom': 38, 'do-block': 14, 'do-block-open': 15, 'expr': 39, 'id': 40, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 47, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'tuple-items': 48, 'unary-expr': 36, 'unary-op': 37},
+    {},
+    {},
+    {},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 17, 'exprs': 49, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {'badd': 55, 'bdiv': 56, 'bmult': 57, 'bsub': 58},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {'keyword': 64, 'keyword-list-item': 65, 'keyword-list-items': 66},
+    {},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 67, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-item': 68, 'list-items': 69, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {'atom': 38, 'do-block': 14, 'do-block-open': 15, 'expr': 70, 'id': 40, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {},
+    {'badd': 55, 'bdiv': 56, 'bmult': 57, 'bsub': 58},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {'do-block-close': 77},
+    {},
+    {},
+    {},
+    {},
+    {'atom': 38, 'do-block': 14, 'do-block-open': 15, 'expr': 78, 'id': 40, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {'atom': 38, 'do-block': 14, 'do-block-open': 15, 'expr': 79, 'id': 40, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {'atom': 38, 'do-block': 14, 'do-block-open': 15, 'expr': 80, 'id': 40, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {'atom': 38, 'do-block': 14, 'do-block-open': 15, 'expr': 81, 'id': 40, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {'atom': 38, 'do-block': 14, 'do-block-open': 15, 'expr': 82, 'id': 40, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 83, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 84, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 86, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-arg': 87, 'fn-args': 88, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword': 89, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {'atom': 90, 'id': 91},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 92, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {},
+    {},
+    {'kw-list-close': 96},
+    {},
+    {},
+    {'list-close': 100},
+    {'badd': 55, 'bdiv': 56, 'bmult': 57, 'bsub': 58},
+    {},
+    {},
+    {},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 102, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 84, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {},
+    {'badd': 55, 'bdiv': 56, 'bmult': 57, 'bsub': 58},
+    {'badd': 55, 'bdiv': 56, 'bmult': 57, 'bsub': 58},
+    {'badd': 55, 'bdiv': 56, 'bmult': 57, 'bsub': 58},
+    {'badd': 55, 'bdiv': 56, 'bmult': 57, 'bsub': 58},
+    {'badd': 55, 'bdiv': 56, 'bmult': 57, 'bsub': 58},
+    {},
+    {},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 106, 'expr-or-fn-apply': 86, 'fn-apply': 107, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-arg': 87, 'fn-args': 108, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword': 89, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {'keyword': 64, 'keyword-list-item': 112, 'kw-list-close': 113},
+    {'keyword': 64, 'keyword-list-item': 115},
+    {},
+    {},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 67, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-close': 118, 'list-item': 119, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 67, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-item': 121, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 39, 'fn-apply': 122, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {},
+    {'badd': 55, 'bdiv': 56, 'bmult': 57, 'bsub': 58},
+    {},
+    {},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 86, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-arg': 126, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword': 89, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {'kw-list-close': 113},
+    {'keyword': 64, 'keyword-list-item': 128},
+    {},
+    {},
+    {},
+    {},
+    {'list-close': 118},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 16, 'expr-or-fn-apply': 67, 'fn-apply': 19, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-item': 130, 'list-open': 29, 'literal': 30, 'match-expr': 32, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {},
+    {'atom': 13, 'do-block': 14, 'do-block-open': 15, 'expr': 39, 'fn-apply': 122, 'fn-apply0': 20, 'fn-apply_noparens': 21, 'fn-apply_parens': 22, 'fn-id': 23, 'fn-module': 24, 'id': 25, 'keyword-list': 26, 'kw-list-open': 27, 'list': 28, 'list-open': 29, 'literal': 30, 'number': 33, 'primary-expr': 34, 'tuple': 35, 'unary-expr': 36, 'unary-op': 37},
+    {},
+    {},
+    {},
+    {},
+    {},
+)
@@ -0,0 +1,223 @@
+import array
+import ast
+import typing
+
+import py
+
+
+_Ref = int      # a field's value: (index << 2) | kind of value - see TreeArena
+
+
+class TreeArena:
+    """
+    A tree of ast.AST nodes, flattened into parallel arrays - the compact form to hold
+        trees in, when many are kept around: a node is its kind, its source offset and
+        its fields, as a few machine integers, instead of a Python object with a __dict__.
+        The tree is rebuilt as ast nodes on demand, by to_tree() (or node(), for a
+        subtree), for ast.dump(), ast.unparse(), or running the passes over it.
+
+    Each of a node's fields is a ref - an index, tagged with what it indexes:
+        - NODE:    the node at that index
+        - PAYLOAD: a scalar (a name, a literal's value, None...) in 'payloads' - where
+                   equal scalars are only stored once, so a name used all over a
+                   program costs a single str
+        - LIST:    a list of refs, 'list_starts'[idx] into 'items'
+        - TUPLE:   ...the same, for a tuple (like a keyword argument's (name, value))
+    ...or ABSENT, for an attribute the node doesn't have (as position attributes the
+        parser doesn't set) - which the rebuilt node won't have either
+
+    Nodes are stored in pre-order, the root first
+    """
+    __slots__ = ('types', 'kinds', 'offsets', 'field_starts', 'fields', 'list_starts', 'items', 'payloads')
+    types: typing.List[type]        # kind -> node class
+    kinds: array.array              # array('B') of each node's kind
+    offsets: array.array            # array('i') of each node's source offset, -1 for none
+    field_starts: array.array       # array('I') of each node's first field, in 'fields'
+    fields: array.array             # array('q') of refs
+    list_starts: array.array        # array('I') of each list's first item, in 'items' - and its end
+    items: array.array              # array('q') of refs
+    payloads: typing.List[typing.Any]
+
+    NODE    = 0
+    PAYLOAD = 1
+    LIST    = 2
+    TUPLE   = 3
+    ABSENT  = -1
+
+    # Node class -> the attributes a node of it is rebuilt from, when not its '_fields'
+    __ATTRS: typing.Dict[type, typing.Tuple[str, ...]] = {
+        py.QualSymbol: ('_symbol', '_module', 'qual_name'),
+        py.Do:         ('_blockbody', ),
+    }
+
+    def __init__(self):
+        self.types = []
+        self.kinds = array.array('B')
+        self.offsets = array.array('i')
+        self.field_starts = array.array('I')
+        self.fields = array.array('q')
+        self.list_starts = array.array('I', [0])
+        self.items = array.array('q')
+        self.payloads = []
+
+    def __len__(self):
+        return len(self.kinds)
+
+    @classmethod
+    def from_tree(cls, tree: ast.AST) -> 'TreeArena':
+        arena = cls()
+        type_ids: typing.Dict[type, int] = {}
+        type_attrs: typing.List[typing.Tuple[str, ...]] = []        # kind -> TreeArena.__attrs()
+        payload_ids: typing.Dict[typing.Tuple[type, typing.Any], int] = {}
+
+        def payload(value: typing.Any) -> _Ref:
+            # ...by repr for floats, as 0.0 == -0.0
+            key = (type(value), repr(value) if isinstance(value, float) else value)
+            try:
+                idx = payload_ids.get(key)
+            except TypeError:                   # unhashable - stored as is, every time
+                idx = len(arena.payloads)
+                arena.payloads.append(value)
+            else:
+                if idx is None:
+                    idx = payload_ids[key] = len(arena.payloads)
+                    arena.payloads.append(value)
+
+            return (idx << 2) | TreeArena.PAYLOAD
+
+        # Pre-order, with a stack of (node, the slot its ref goes in): nodes get their
+        #   index when they're reached, their fields' slots filled in by their children
+        pending: typing.List[typing.Tuple[ast.AST, array.array, int]] = [(tree, arena.fields, -1)]
+
+        while pending:
+            (node, slots, slot) = pending.pop()
+
+            idx = len(arena.kinds)
+            if slot >= 0:
+                slots[slot] = (idx << 2) | TreeArena.NODE
+
+            kind = type_ids.get(type(node))
+            if kind is None:
+                kind = type_ids[type(node)] = len(arena.types)
+                arena.types.append(type(node))
+                type_attrs.append(TreeArena.__attrs(type(node)))
+
+            offset = getattr(node, 'offset', None)
+
+            arena.kinds.append(kind)
+            arena.offsets.append(offset if offset is not None else -1)
+            arena.field_starts.append(len(arena.fields))
+
+            attrs = type_attrs[kind]
+            first = len(arena.fields)
+            arena.fields.extend([0] * len(attrs))
+
+            children = []
+            for (pos, attr) in enumerate(attrs):
+                try:
+                    children.append((getattr(node, attr), arena.fields, first + pos))
+                except AttributeError:
+                    arena.fields[first + pos] = TreeArena.ABSENT
+
+            # ...their children, breadth-first into the refs, then depth-first onto the stack
+            nodes = []
+            for (value, value_slots, value_slot) in children:     # (grows as lists are met)
+                if isinstance(value, ast.AST):
+                    nodes.append((value, value_slots, value_slot))
+                elif isinstance(value, (list, tuple)):
+                    tag = TreeArena.LIST if isinstance(value, list) else TreeArena.TUPLE
+                    value_slots[value_slot] = ((len(arena.list_starts) - 1) << 2) | tag
+
+                    start = len(arena.items)
+                    arena.items.extend([0] * len(value))
+                    arena.list_starts.append(len(arena.items))
+
+                    children.extend((item, arena.items, start + pos) for (pos, item) in enumerate(value))
+                else:
+                    value_slots[value_slot] = payload(value)
+
+            pending.extend(reversed(nodes))
+
+        return arena
+
+    def to_tree(self) -> ast.AST:
+        return self.node(0)
+
+    def node(self, idx: int) -> ast.AST:
+        """
+        :return: the subtree rooted at node 'idx', rebuilt as ast nodes
+        """
+        built: typing.Dict[int, ast.AST] = {}
+
+        # Post-order: a node is only built once all the nodes it refers to have been
+        order: typing.List[int] = []
+        pending = [idx]
+        while pending:
+            node = pending.pop()
+            order.append(node)
+
+            pending.extend(self.__child_nodes(node))
+
+        for node in reversed(order):
+            built[node] = self.__build(node, built)
+
+        return built[idx]
+
+    def memory_size(self) -> int:
+        """
+        :return: the bytes held by the arrays - the payloads not included
+        """
+        arrays = (self.kinds, self.offsets, self.field_starts, self.fields, self.list_starts, self.items)
+
+        return sum(arr.itemsize * len(arr) for arr in arrays)
+
+    def __child_nodes(self, idx: int) -> typing.Iterator[int]:
+        start = self.field_starts[idx]
+        refs = list(self.fields[start:start + len(TreeArena.__attrs(self.types[self.kinds[idx]]))])
+
+        while refs:
+            ref = refs.pop()
+            if ref == TreeArena.ABSENT:
+                continue
+
+            (target, tag) = (ref >> 2, ref & 3)
+
+            if tag == TreeArena.NODE:
+                yield target
+            elif tag != TreeArena.PAYLOAD:
+                refs.extend(self.items[self.list_starts[target]:self.list_starts[target + 1]])
+
+    def __build(self, idx: int, built: typing.Dict[int, ast.AST]) -> ast.AST:
+        cls = self.types[self.kinds[idx]]
+        node = cls.__new__(cls)
+
+        attrs = TreeArena.__attrs(cls)
+        start = self.field_starts[idx]
+        for (attr, ref) in zip(attrs, self.fields[start:start + len(attrs)]):
+            if ref != TreeArena.ABSENT:
+                setattr(node, attr, self.__value(ref, built))
+
+        if self.offsets[idx] >= 0:
+            node.offset = self.offsets[idx]
+
+        return node
+
+    def __value(self, ref: _Ref, built: typing.Dict[int, ast.AST]) -> typing.Any:
+        (target, tag) = (ref >> 2, ref & 3)
+
+        if tag == TreeArena.NODE:
+            return built[target]
+        if tag == TreeArena.PAYLOAD:
+            return self.payloads[target]
+
+        values = [self.__value(item, built) for item in self.items[self.list_starts[target]:self.list_starts[target + 1]]]
+
+        return values if tag == TreeArena.LIST else tuple(values)
+
+    @staticmethod
+    def __attrs(cls: type) -> typing.Tuple[str, ...]:
+        attrs = TreeArena.__ATTRS.get(cls)
+        if attrs is None:
+            attrs = cls._fields + (cls._attributes if cls.__module__ == 'ast' else ())
+
+        return attrs
@@ -0,0 +1,184 @@
+"""
+Compiles a whole tree of Fluorite sources, in parallel - each .fl file under the source
+directory into a .pyc at the same relative path under the output one, which Python then
+imports like any other sourceless module:
+
+    python -m compiler build <dir> [-o <out-dir>] [-j <jobs>] [--profile [text|json]] [--no-cache]
+
+Each worker process builds its own Compiler once, then reuses it for all the files it's
+given - with a CodeCache, so unchanged sources are only ever compiled once. Profiling
+measures every phase of every file compiled (see compiler.instrument)
+"""
+import concurrent.futures
+import importlib.util
+import marshal
+import os
+import pathlib
+import time
+import tracemalloc
+import types
+import typing
+
+import rply
+
+from .codecache import CodeCache
+from .driver import Compiler
+from .importer import FluoriteFinder
+from .instrument import FileProfile, Profiler
+
+
+class FileResult:
+    """ The outcome of compiling one source file """
+    __slots__ = ('path', 'seconds', 'error', 'profile')
+    path: str                       # relative to the source directory
+    seconds: float
+    error: typing.Optional[str]     # why it failed to compile, if it did
+    profile: typing.Optional[FileProfile]
+
+    def __init__(self, path: str, seconds: float, error: typing.Optional[str] = None,
+                 profile: typing.Optional[FileProfile] = None):
+        self.path = path
+        self.seconds = seconds
+        self.error = error
+        self.profile = profile
+
+
+class BuildResult:
+    __slots__ = ('files', 'seconds')
+    files: typing.List[FileResult]
+    seconds: float                  # wall time, for the whole build
+
+    def __init__(self, files: typing.List[FileResult], seconds: float):
+        self.files = files
+        self.seconds = seconds
+
+    @property
+    def failed(self) -> typing.List[FileResult]:
+        return [result for result in self.files if result.error is not None]
+
+    @property
+    def profiles(self) -> typing.List[FileProfile]:
+        return [result.profile for result in self.files if result.profile is not None]
+
+
+_compiler: typing.Optional[Compiler] = None     # the worker process's own
+_tracing: bool = False                          # whether the worker started tracemalloc itself
+
+
+def find_sources(src_dir: str) -> typing.List[str]:
+    """
+    :return: the paths of all the .fl files under 'src_dir', relative to it - sorted
+    """
+    sources = []
+    for (dir_path, dir_names, file_names) in os.walk(src_dir):
+        dir_names.sort()
+
+        for name in sorted(file_names):
+            if name.endswith(FluoriteFinder.SUFFIX):
+                sources.append(os.path.relpath(os.path.join(dir_path, name), src_dir))
+
+    return sources
+
+
+def output_path(out_dir: str, path: str) -> str:
+    return os.path.join(out_dir, path[:-len(FluoriteFinder.SUFFIX)] + '.pyc')
+
+
+def build(src_dir: str, out_dir: str, *, jobs: typing.Optional[int] = None,
+          cache_dir: typing.Optional[str] = None, use_cache: bool = True, profile: bool = False) -> BuildResult:
+    """
+    Compiles all the .fl files under 'src_dir' into 'out_dir'
+
+    :param jobs: the worker processes to compile with - as many as there are CPUs by default,
+         and none (everything compiled by this process) for 1
+    :param cache_dir: see CodeCache
+    :param profile: profile each file's compilation - tracing allocations too, which slows
+         it down quite a bit
+    """
+    start = time.perf_counter()
+
+    sources = find_sources(src_dir)
+    jobs = jobs or os.cpu_count() or 1
+
+    options = (cache_dir, use_cache, profile)
+
+    if jobs == 1 or len(sources) <= 1:
+        _init_worker(*options)
+        try:
+            files = [_compile_file(src_dir, out_dir, path) for path in sources]
+        finally:
+            _reset_worker()
+    else:
+        # ...in chunks, a few per worker: thousands of small files would otherwise
+        #   spend more time being sent around than compiled
+        chunk_size = max(1, len(sources) // (jobs * 4))
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                                    initargs=options) as pool:
+            files = list(pool.map(_compile_file, [src_dir] * len(sources), [out_dir] * len(sources), sources,
+                                  chunksize=chunk_size))
+
+    return BuildResult(files, time.perf_counter() - start)
+
+
+def _init_worker(cache_dir: typing.Optional[str], use_cache: bool, profile: bool):
+    global _compiler, _tracing
+
+    _tracing = profile and not tracemalloc.is_tracing()
+    if _tracing:
+        tracemalloc.start()
+
+    _compiler = Compiler(code_cache=CodeCache(cache_dir) if use_cache else None,
+                         profiler=Profiler() if profile else None)
+
+
+def _reset_worker():
+    global _compiler, _tracing
+
+    if _tracing:            # ...and never a session the caller started
+        tracemalloc.stop()
+        _tracing = False
+
+    _compiler = None
+
+
+def _compile_file(src_dir: str, out_dir: str, path: str) -> FileResult:
+    start = time.perf_counter()
+
+    src_path = pathlib.Path(src_dir, path)
+    error = None
+    try:
+        code = _compiler.compile(src_path)
+        _write_pyc(output_path(out_dir, path), code, os.stat(src_path))
+    except Exception as e:      # ...any file's failure, down to a RecursionError, is only that file's
+        error = _describe(e)
+
+    seconds = time.perf_counter() - start
+
+    profiles = _compiler.profiler.take() if _compiler.profiler is not None else []
+
+    return FileResult(path, seconds, error, profiles[0] if profiles else None)
+
+
+def _write_pyc(path: str, code: types.CodeType, source_stat: os.stat_result):
+    """
+    Writes 'code' as a timestamp-based .pyc (see PEP 552) of the source 'source_stat' is of
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, 'wb') as f:
+        f.write(importlib.util.MAGIC_NUMBER)
+        f.write((0).to_bytes(4, 'little'))      # flags: timestamp-based
+        f.write((int(source_stat.st_mtime) & 0xFFFFFFFF).to_bytes(4, 'little'))
+        f.write((source_stat.st_size & 0xFFFFFFFF).to_bytes(4, 'little'))
+        f.write(marshal.dumps(code))
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, (rply.LexingError, rply.ParsingError)):
+        pos = error.getsourcepos()
+        where = f"line {pos.lineno}, column {pos.colno}" if pos is not None else "unknown position"
+
+        return f"{type(error).__name__} at {where}"
+
+    return f"{type(error).__name__}: {error}"
@@ -0,0 +1,103 @@
+import contextlib
+import importlib.util
+import marshal
+import os
+import sys
+import tempfile
+import types
+import typing
+
+import xxhash
+
+from .source import SourceBuffer
+from .tablecache import ParseTableCache
+
+
+class CodeCache:
+    """
+    On-disk, content-addressed cache of compiled Fluorite modules - marshalled code objects
+        keyed by the xxh64 hash of their source. The compiler's key (Compiler.key: its
+        version, the grammar's hash and options) picks the directory the entries go in,
+        and the Python version (its cache tag, like in __pycache__) their file name, so
+        a change to any of them never hits a stale entry
+
+    Sources with the same contents share an entry - the code loaded from it gets the
+        filename it's looked up for
+    """
+    __slots__ = ('_dir', )
+    _dir: str
+
+    __MAGIC = importlib.util.MAGIC_NUMBER      # marshal's format changes with the Python version
+
+    def __init__(self, cache_dir: typing.Optional[str] = None):
+        self._dir = cache_dir if cache_dir is not None else ParseTableCache.default_dir()
+
+    @property
+    def cache_dir(self) -> str:
+        return self._dir
+
+    @staticmethod
+    def source_hash(source: SourceBuffer) -> str:
+        """
+        :return: the xxh64 hex digest of 'source' - of its UTF-8 encoding, for a str
+        """
+        return xxhash.xxh64_hexdigest(source.encode() if isinstance(source, str) else source)
+
+    def cache_file(self, source_hash: str, compiler_key: str) -> str:
+        return os.path.join(self._dir, f"code-{compiler_key}", f"{source_hash}.{sys.implementation.cache_tag}.flc")
+
+    def load(self, source_hash: str, compiler_key: str, filename: str) -> typing.Optional[types.CodeType]:
+        """
+        :return: the cached code for the source hashed to 'source_hash', or None if
+             there's none (or it can't be read)
+        """
+        try:
+            with open(self.cache_file(source_hash, compiler_key), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if not data.startswith(CodeCache.__MAGIC):
+            return None
+
+        try:
+            code = marshal.loads(memoryview(data)[len(CodeCache.__MAGIC):])
+        except (EOFError, ValueError, TypeError):     # truncated or corrupt - recompile it
+            return None
+
+        if not isinstance(code, types.CodeType):
+            return None
+
+        return CodeCache.__with_filename(code, filename)
+
+    def store(self, source_hash: str, compiler_key: str, code: types.CodeType):
+        cache_file = self.cache_file(source_hash, compiler_key)
+        entry_dir = os.path.dirname(cache_file)
+
+        tmp_file = None
+        try:
+            os.makedirs(entry_dir, mode=0o700, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile('wb', dir=entry_dir, delete=False) as f:
+                tmp_file = f.name
+                f.write(CodeCache.__MAGIC)
+                f.write(marshal.dumps(code))
+
+            os.replace(tmp_file, cache_file)    # atomic, like ParseTableCache's
+            tmp_file = None
+        except OSError:
+            return
+        finally:
+            if tmp_file is not None:            # ...failed halfway, like ParseTableCache's
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(tmp_file)
+
+    @staticmethod
+    def __with_filename(code: types.CodeType, filename: str) -> types.CodeType:
+        if code.co_filename == filename:
+            return code
+
+        consts = tuple(CodeCache.__with_filename(const, filename) if isinstance(const, types.CodeType) else const
+                       for const in code.co_consts)
+
+        return code.replace(co_filename=filename, co_consts=consts)
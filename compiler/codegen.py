@@ -1,8 +1,479 @@
 import ast
+import types
+import typing
+
+import py
+
+from .codeobj import CodeObject
+from .errors import CompileError
+from .source import LineIndex
+from .symbol import ScopeAnalyzer
+
+
+_Position = typing.Tuple[int, int]      # (lineno, col_offset) - as in Python's ast
 
 
 class CodeGen:
-    __slots__ = ('_ast', )
+    """
+    Lowers the IR tree into a Python ast.Module, which is then compiled - once - into a code
+        object. Fluorite values are plain Python ones: integers are ints, lists are lists,
+        tuples are tuples (a keyword list being a list of {atom, value} tuples) and atoms
+        are fluorite.Atoms, interned by the module's prologue when it's run. The prologue
+        also links each qualified function called, by arity - 'Math.pow/2' - to a global of
+        its own, resolved on its first call (see fluorite.runtime.FunctionRef).
+
+    Expressions are lowered in evaluation order: whatever needs statements of its own (a
+        match, a do block's head...) has them emitted ahead of the expression using its
+        value, the operands evaluated before it getting spilled into temporaries first.
+
+    The program itself runs in a function - MAIN - so its variables, and the temporaries,
+        are fast locals: only the module-level variables (those bound at the top level,
+        which are the module's exports) are globals, declared as such in MAIN. Each do
+        block is a scope of its own, its locals being renamed where they'd clash with
+        other names in MAIN (see compiler.symbol.ScopeAnalyzer).
+
+    Running the code leaves the value of the program's last expression in RESULT.
+        Names starting with '__fl_' are reserved for the generated code
+    """
+    __slots__ = ('_ast', '_filename', '_lines',
+                 '_atoms', '_functions', '_builtins', '_ntemps', '_max_temps', '_stmts', '_pos', '_item_start',
+                 '_module', '_code')
+    _ast: ast.AST
+    _filename: str
+    _lines: typing.Optional[LineIndex]     # resolves node offsets into line numbers
+
+    _atoms: typing.Dict[str, str]       # atom name -> the global it's interned into
+    _functions: typing.Dict[typing.Tuple[str, int], str]    # (qualified function name, arity) -> the global it's linked to
+    _builtins: typing.Set[str]          # builtins the generated code imports under reserved names
+    _ntemps: int                        # the temporaries in use
+    _max_temps: int                     # ...and the most ever used at once
+    _stmts: typing.List[ast.stmt]       # the statements emitted so far, in order
+    _pos: _Position                     # of the statements being emitted
+    _item_start: bool                   # the next located node sets '_pos'
 
-    def __init__(self, _ast: ast.AST):
+    _module: typing.Optional[ast.Module]
+    _code: typing.Optional[types.CodeType]
+
+    VERSION = 7                         # bumped whenever the code generated for a tree changes
+
+    RUNTIME = '__fl_rt'                 # fluorite.runtime, as imported by the generated code
+    RESULT  = '__fl_result__'
+    MAIN    = '__fl_main__'
+
+    __RESERVED = '__fl_'
+    __WILDCARD = '_'
+
+    def __init__(self, _ast: ast.AST, *, filename: str = '<fluorite>', lines: typing.Optional[LineIndex] = None):
         self._ast = _ast
+        self._filename = filename
+        self._lines = lines
+
+        self._atoms = {}
+        self._functions = {}
+        self._builtins = set()
+        self._ntemps = 0
+        self._max_temps = 0
+        self._stmts = []
+        self._pos = (1, 0)
+        self._item_start = True
+
+        self._module = None
+        self._code = None
+
+    @property
+    def module(self) -> ast.Module:
+        """
+        :return: the Python ast.Module the IR tree lowers into - lowered on first access
+        """
+        if self._module is None:
+            self._module = self.__lower_module(self._ast)
+
+        return self._module
+
+    @property
+    def code(self) -> types.CodeType:
+        if self._code is None:
+            self._code = compile(self.module, self._filename, 'exec')
+
+        return self._code
+
+    def _lower(self, node: ast.AST) -> ast.expr:
+        """
+        :return: the Python expression evaluating to 'node's value, after emitting any
+             statements it takes to compute it
+        """
+        offset = getattr(node, 'offset', None)
+
+        pos = self.__position(offset)
+        if pos is not None and self._item_start:
+            (self._pos, self._item_start) = (pos, False)
+
+        lower = getattr(self, '_lower_' + type(node).__name__, None)
+        if lower is None:
+            raise CompileError(f"can't compile {type(node).__name__} nodes", offset)
+
+        expr = lower(node)
+        if pos is not None:
+            CodeGen.__locate(expr, pos)
+
+        return expr
+
+    def _lower_Expr(self, node: ast.Expr) -> ast.expr:
+        return self._lower(node.value)
+
+    def _lower_Constant(self, node: ast.Constant) -> ast.expr:
+        return ast.Constant(node.value)
+
+    def _lower_FlInteger(self, node: py.FlInteger) -> ast.expr:
+        return ast.Constant(node.value)
+
+    def _lower_FlString(self, node: py.FlString) -> ast.expr:
+        return ast.Constant(node.value)
+
+    def _lower_FlAtom(self, node: py.FlAtom) -> ast.expr:
+        return self.__atom(node.name)
+
+    def _lower_FlList(self, node: py.FlList) -> ast.expr:
+        return ast.List(elts=self.__lower_seq(node.value), ctx=ast.Load())
+
+    def _lower_FlTuple(self, node: py.FlTuple) -> ast.expr:
+        return ast.Tuple(elts=self.__lower_seq(node.value), ctx=ast.Load())
+
+    def _lower_Symbol(self, node: py.Symbol) -> ast.expr:
+        if node.name == CodeGen.__WILDCARD:
+            raise CompileError(f"'{CodeGen.__WILDCARD}' can only be used in patterns", node.offset)
+
+        return CodeGen.__load(CodeGen.__var(node))
+
+    def _lower_Call(self, node: ast.Call) -> ast.expr:
+        if isinstance(node.func, py.QualSymbol):
+            (func, args) = (self.__function(node.func.qual_name, len(node.args)), self.__lower_seq(node.args))
+        else:
+            (func, *args) = self.__lower_seq([node.func, *node.args])
+
+        return ast.Call(func=func, args=args, keywords=[])
+
+    def _lower_BinOp(self, node: ast.BinOp) -> ast.expr:
+        (left, right) = self.__lower_seq([node.left, node.right])
+
+        return ast.BinOp(left=left, op=node.op, right=right)
+
+    def _lower_UnaryOp(self, node: ast.UnaryOp) -> ast.expr:
+        return ast.UnaryOp(op=node.op, operand=self._lower(node.operand))
+
+    def _lower_Do(self, node: py.Do) -> ast.expr:
+        pos = self._pos
+        tail = self.__lower_block(node.body)
+        self._pos = pos     # back to the statement the block is part of
+
+        return tail
+
+    def _lower_Match(self, node: py.Match) -> ast.expr:
+        value = self._lower(node.bind.pattern)
+        target = node.target.pattern
+
+        if isinstance(target, py.Symbol) and target.name != CodeGen.__WILDCARD:
+            var = CodeGen.__var(target)
+            self.__emit(ast.Assign(targets=[CodeGen.__store(var)], value=value))
+
+            return CodeGen.__load(var)
+
+        subject = value if isinstance(value, ast.Name) and self.__is_stable(value) else self.__spill(value)
+
+        tests: typing.List[ast.expr] = []
+        self.__match_pattern(target, subject.id, subject.id, tests, set())
+
+        if tests:
+            self.__emit_match_check(tests, subject.id)
+
+        return subject
+
+    def __match_pattern(self, pattern: ast.expr, var: str, subject: str,
+                        tests: typing.List[ast.expr], bound: typing.Set[str]):
+        """
+        Compiles matching the value in 'var' against 'pattern' - as a single pattern
+            can only ever take one path through a decision tree, that's the path
+            with its tests ordered and merged:
+            - a collection's type is checked first, and then it's unpacked - Python's
+                unpacking checking its length, and being the cheapest way to get at its
+                items - straight into the variables it binds
+            - its nested collections are then matched the same way, level by level
+            - the tests on the items themselves - literals, and variables bound twice -
+                are only collected into 'tests', to be checked together at the end
+
+        :param subject: the variable holding the whole value matched - for MatchErrors
+        :param bound: the variables bound so far
+        """
+        if isinstance(pattern, py.Symbol):
+            if pattern.name == CodeGen.__WILDCARD:
+                return
+
+            binder = CodeGen.__var(pattern)
+            if binder in bound:             # bound twice => both values must be the same
+                tests.append(ast.Compare(left=CodeGen.__load(var), ops=[ast.Eq()],
+                                         comparators=[CodeGen.__load(binder)]))
+            else:
+                bound.add(binder)
+                self.__emit(ast.Assign(targets=[CodeGen.__store(binder)], value=CodeGen.__load(var)))
+
+        elif isinstance(pattern, py.FlAtom):
+            tests.append(ast.Compare(left=CodeGen.__load(var), ops=[ast.Is()],
+                                     comparators=[self.__atom(pattern.name)]))
+
+        elif isinstance(pattern, (py.FlInteger, py.FlString)) or CodeGen.__is_signed_integer(pattern):
+            tests.append(ast.Compare(left=CodeGen.__load(var), ops=[ast.Eq()],
+                                     comparators=[self._lower(pattern)]))
+
+        elif isinstance(pattern, (py.FlTuple, py.FlList)):
+            self.__match_collection(pattern, var, subject, tests, bound)
+
+        else:
+            raise CompileError(f"{type(pattern).__name__} can't be used in a pattern",
+                               getattr(pattern, 'offset', None))
+
+    def __match_collection(self, pattern: typing.Union[py.FlTuple, py.FlList], var: str, subject: str,
+                           tests: typing.List[ast.expr], bound: typing.Set[str]):
+        items: typing.List[ast.expr] = pattern.value
+        kind = self.__builtin('tuple' if isinstance(pattern, py.FlTuple) else 'list')
+
+        # ...__class__ is cheaper than a type() call
+        wrong_kind = ast.Compare(left=ast.Attribute(value=CodeGen.__load(var), attr='__class__', ctx=ast.Load()),
+                                 ops=[ast.IsNot()], comparators=[kind])
+
+        if all(isinstance(item, py.Symbol) and item.name == CodeGen.__WILDCARD for item in items):
+            wrong_len = ast.Compare(left=ast.Call(func=self.__builtin('len'), args=[CodeGen.__load(var)], keywords=[]),
+                                    ops=[ast.NotEq()], comparators=[ast.Constant(len(items))])
+
+            return self.__emit_match_error(ast.BoolOp(op=ast.Or(), values=[wrong_kind, wrong_len]), subject)
+
+        self.__emit_match_error(wrong_kind, subject)
+
+        targets: typing.List[ast.Name] = []
+        nested: typing.List[typing.Tuple[ast.expr, str]] = []
+
+        for item in items:
+            if isinstance(item, py.Symbol) and item.name != CodeGen.__WILDCARD and CodeGen.__var(item) not in bound:
+                bound.add(CodeGen.__var(item))
+                targets.append(CodeGen.__store(CodeGen.__var(item)))
+            else:
+                temp = self.__temp()
+                targets.append(CodeGen.__store(temp))
+                nested.append((item, temp))
+
+        # try: <targets...> = var
+        # except ValueError: raise MatchError(subject) from None
+        #
+        #   ...the unpacking checks the length before binding anything, and costs
+        #   nothing extra when it fits - unlike a len() call
+        unpack = ast.Assign(targets=[ast.Tuple(elts=targets, ctx=ast.Store())], value=CodeGen.__load(var))
+        wrong_len = ast.ExceptHandler(type=self.__builtin('ValueError'), name=None,
+                                      body=[self.__match_error(subject)])
+
+        self.__emit(ast.Try(body=[CodeGen.__locate(unpack, self._pos)], handlers=[wrong_len],
+                            orelse=[], finalbody=[]))
+
+        for (item, temp) in nested:
+            self.__match_pattern(item, temp, subject, tests, bound)
+
+    def __emit_match_check(self, tests: typing.List[ast.expr], subject: str):
+        cond = tests[0] if len(tests) == 1 else ast.BoolOp(op=ast.And(), values=tests)
+
+        self.__emit_match_error(ast.UnaryOp(op=ast.Not(), operand=cond), subject)
+
+    def __emit_match_error(self, cond: ast.expr, subject: str):
+        """
+        Emits 'if <cond>: raise MatchError(<subject>)'
+        """
+        self.__emit(ast.If(test=cond, body=[self.__match_error(subject)], orelse=[]))
+
+    def __match_error(self, subject: str) -> ast.Raise:
+        error = ast.Call(func=self.__runtime('MatchError'), args=[CodeGen.__load(subject)], keywords=[])
+
+        return CodeGen.__locate(ast.Raise(exc=error, cause=ast.Constant(None)), self._pos)
+
+    def __lower_module(self, unit: py.CompilationUnit) -> ast.Module:
+        main = CodeObject(CodeGen.MAIN, ScopeAnalyzer().analyze(unit))
+
+        result = self.__lower_block(unit.body)
+        self.__emit(ast.Return(value=result))
+
+        if main.global_names:
+            self._stmts.insert(0, ast.Global(names=main.global_names))
+
+        no_args = ast.arguments(posonlyargs=[], args=[], vararg=None, kwonlyargs=[], kw_defaults=[],
+                                kwarg=None, defaults=[])
+        func = ast.FunctionDef(name=main.name, args=no_args, body=self._stmts, decorator_list=[], returns=None)
+        run = ast.Assign(targets=[CodeGen.__store(CodeGen.RESULT)],
+                         value=ast.Call(func=CodeGen.__load(main.name), args=[], keywords=[]))
+
+        module = ast.Module(body=self.__prologue() + [func, run], type_ignores=[])
+
+        return ast.fix_missing_locations(module)
+
+    def __lower_block(self, body: typing.List[ast.AST]) -> ast.expr:
+        """
+        Emits the statements for all of the block's expressions but the last (the tail)
+            one, which the block evaluates to
+
+        :return: the tail expression
+        """
+        if not body:
+            return ast.Constant(None)
+
+        for node in body[:-1]:
+            self._item_start = True
+            ntemps = self._ntemps
+
+            expr = self._lower(node)
+            if not (isinstance(node, py.Match) or self.__is_stable(expr)):    # a match's value is its subject
+                self.__emit(ast.Expr(value=expr))
+
+            self._ntemps = ntemps       # ...its temporaries are dead past its statements
+
+        self._item_start = True
+
+        return self._lower(body[-1])
+
+    def __lower_seq(self, nodes: typing.Iterable[ast.AST]) -> typing.List[ast.expr]:
+        """
+        :return: the expressions for 'nodes' - evaluated left to right, even when some of
+             them have statements emitted ahead of them
+        """
+        exprs: typing.List[ast.expr] = []
+
+        for node in nodes:
+            (outer, self._stmts) = (self._stmts, [])
+            expr = self._lower(node)
+            (stmts, self._stmts) = (self._stmts, outer)
+
+            if stmts:
+                # ...the expressions before it must still come first - spilled into temporaries
+                #   none of its statements (which run after the spills) use
+                self._ntemps = self._max_temps
+
+                for (idx, prev) in enumerate(exprs):
+                    if not self.__is_stable(prev):
+                        exprs[idx] = self.__spill(prev)
+
+                self._stmts.extend(stmts)
+
+            exprs.append(expr)
+
+        return exprs
+
+    def __prologue(self) -> typing.List[ast.stmt]:
+        prologue: typing.List[ast.stmt] = [
+            ast.ImportFrom(module='fluorite', names=[ast.alias(name='runtime', asname=CodeGen.RUNTIME)], level=0),
+        ]
+
+        if self._builtins:
+            aliases = [ast.alias(name=name, asname=CodeGen.__RESERVED + name) for name in sorted(self._builtins)]
+
+            prologue.append(ast.ImportFrom(module='builtins', names=aliases, level=0))
+
+        if self._atoms:
+            names = ast.Tuple(elts=[CodeGen.__store(var) for var in self._atoms.values()], ctx=ast.Store())
+            interned = ast.Call(func=ast.Attribute(value=self.__runtime('Atom'), attr='interned', ctx=ast.Load()),
+                                args=[ast.Tuple(elts=list(map(ast.Constant, self._atoms)), ctx=ast.Load())],
+                                keywords=[])
+
+            prologue.append(ast.Assign(targets=[names], value=interned))
+
+        if self._functions:
+            refs = [ast.Tuple(elts=list(map(ast.Constant, (var, *qual_name.rpartition('.')[::2], arity))), ctx=ast.Load())
+                    for ((qual_name, arity), var) in self._functions.items()]
+            own_globals = ast.Call(func=CodeGen.__load('globals'), args=[], keywords=[])
+
+            link = ast.Call(func=self.__runtime('link'), args=[own_globals, ast.Tuple(elts=refs, ctx=ast.Load())],
+                            keywords=[])
+
+            prologue.append(ast.Expr(value=link))
+
+        return prologue
+
+    def __emit(self, stmt: ast.stmt):
+        self._stmts.append(CodeGen.__locate(stmt, self._pos))
+
+    def __spill(self, expr: ast.expr) -> ast.Name:
+        """
+        :return: a (load of) the temporary 'expr' has been assigned to
+        """
+        temp = self.__temp()
+        self.__emit(ast.Assign(targets=[CodeGen.__store(temp)], value=expr))
+
+        return CodeGen.__load(temp)
+
+    def __temp(self) -> str:
+        temp = f"{CodeGen.__RESERVED}tmp_{self._ntemps}"
+
+        self._ntemps += 1
+        self._max_temps = max(self._max_temps, self._ntemps)
+
+        return temp
+
+    def __atom(self, name: str) -> ast.Name:
+        var = self._atoms.get(name)
+        if var is None:
+            var = self._atoms[name] = f"{CodeGen.__RESERVED}atom_{len(self._atoms)}"
+
+        return CodeGen.__load(var)
+
+    def __function(self, qual_name: str, arity: int) -> ast.Name:
+        var = self._functions.get((qual_name, arity))
+        if var is None:
+            var = self._functions[(qual_name, arity)] = f"{CodeGen.__RESERVED}fn_{len(self._functions)}"
+
+        return CodeGen.__load(var)
+
+    def __builtin(self, name: str) -> ast.Name:
+        self._builtins.add(name)
+
+        return CodeGen.__load(CodeGen.__RESERVED + name)      # user code may well shadow it
+
+    def __runtime(self, attr: str) -> ast.Attribute:
+        return ast.Attribute(value=CodeGen.__load(CodeGen.RUNTIME), attr=attr, ctx=ast.Load())
+
+    def __position(self, offset: typing.Optional[int]) -> typing.Optional[_Position]:
+        if offset is None or self._lines is None:
+            return None
+
+        (lineno, colno) = self._lines.position(offset)
+
+        return (lineno, colno - 1)
+
+    @staticmethod
+    def __is_stable(expr: ast.expr) -> bool:
+        """
+        :return: whether evaluating 'expr' has no effects, and always gives the same value -
+             true of constants and the reserved names, which are only ever assigned once
+        """
+        return isinstance(expr, ast.Constant) or \
+            (isinstance(expr, ast.Name) and expr.id.startswith(CodeGen.__RESERVED))
+
+    @staticmethod
+    def __is_signed_integer(node: ast.AST) -> bool:
+        return isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)) \
+            and isinstance(node.operand, py.FlInteger)
+
+    @staticmethod
+    def __var(node: py.Symbol) -> str:
+        """
+        :return: the Python name of the variable 'node' refers to - its own, when it's not
+             resolved to any (it's then looked up among the globals, and the builtins)
+        """
+        return node.name if node.binding is None else node.binding.py_name
+
+    @staticmethod
+    def __locate(node: ast.AST, pos: _Position) -> ast.AST:
+        (node.lineno, node.col_offset) = pos
+        (node.end_lineno, node.end_col_offset) = pos
+
+        return node
+
+    @staticmethod
+    def __load(name: str) -> ast.Name:
+        return ast.Name(id=name, ctx=ast.Load())
+
+    @staticmethod
+    def __store(name: str) -> ast.Name:
+        return ast.Name(id=name, ctx=ast.Store())
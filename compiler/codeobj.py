@@ -4,8 +4,27 @@ from .symbol import Symbol, SymbolTable
 
 
 class CodeObject:
-    __slots__ = ('_syms', )
+    """
+    A Python function the generated code defines, running the code of a scope - its
+        variables, and those of the blocks nested in it, being the function's locals
+        (module-level variables excepted, those being globals it declares)
+    """
+    __slots__ = ('_syms', 'name')
     _syms: SymbolTable
+    name: str
+
+    def __init__(self, name: str, syms: SymbolTable):
+        self._syms = syms
+        self.name = name
+
+    @property
+    def symbols(self) -> SymbolTable:
+        return self._syms
+
+    @property
+    def global_names(self) -> typing.List[str]:
+        """
+        :return: the module-level variables the function binds, to be declared global in it
+        """
+        return sorted(sym.py_name for sym in self._syms.symbols if sym.kind == Symbol.MODULE)
 
-    def __init__(self):
-        self._syms = SymbolTable()
@@ -1,10 +1,315 @@
 import ast
+import collections
+import functools
+import itertools
+import operator
+import typing
+
+import py
+
+
+_Number = typing.Union[int, float]
 
 
 class IRTransformer(ast.NodeTransformer):
-    __slots__ = ('_tree', '_result')
+    """
+    Rewrites the parser's source tree into the IR that CodeGen lowers, by normalizing away
+        the parser's leftovers:
+        - keyword arguments ('f a, key: 1') - kept as raw (name, value) pairs among a call's
+            args - are gathered into a keyword list, passed as the call's last argument
+        - the keys of keyword lists are turned from raw strs into FlAtoms
+
+    ...and, when optimizing, by simplifying arithmetic - outside of match patterns:
+        - operators over numeric literals are folded into their result
+        - the identities x*1, 1*x, x+0, 0+x and x-0 are reduced to x - like Fluorite's
+            arithmetic, that assumes x is a number
+        - a do block made of just a literal is replaced by it, so it folds with its operands
+        - then DeadCodeEliminator drops the computations nothing observes
+
+    The source tree is left as it was parsed: it's a copy of it that's transformed (in
+        place) into the IR
+    """
+    __slots__ = ('_tree', '_result', '_optimize')
     _tree: ast.AST
-    _result: ast.Module
+    _result: typing.Optional[ast.AST]
+    _optimize: bool
 
-    def __init__(self, tree: ast.AST):
+    __BINARY_OPS: typing.Dict[type, typing.Callable[[_Number, _Number], _Number]] = {
+        ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv,
+    }
+    __UNARY_OPS: typing.Dict[type, typing.Callable[[_Number], _Number]] = {
+        ast.UAdd: operator.pos, ast.USub: operator.neg,
+    }
+
+    def __init__(self, tree: ast.AST, *, optimize: bool = True):
         self._tree = tree
+        self._result = None
+        self._optimize = optimize
+
+    def transform(self) -> ast.AST:
+        """
+        :return: the IR tree, transformed on the first call only
+        """
+        if self._result is None:
+            tree = self.visit(IRTransformer.__copy(self._tree))
+
+            self._result = DeadCodeEliminator(tree).visit(tree) if self._optimize else tree
+
+        return self._result
+
+    def visit_Call(self, node: ast.Call) -> ast.Call:
+        kw_pairs = [arg for arg in node.args if isinstance(arg, tuple)]
+        if kw_pairs:
+            node.args = [arg for arg in node.args if not isinstance(arg, tuple)]
+            node.args.append(py.FlList([py.FlTuple(list(pair)) for pair in kw_pairs]))
+
+        return self.generic_visit(node)
+
+    def visit_FlTuple(self, node: py.FlTuple) -> py.FlTuple:
+        items = node.value
+        if items and isinstance(items[0], str):
+            items[0] = py.FlAtom(items[0])      # a keyword list item - {:key, value}
+
+        return self.generic_visit(node)
+
+    def visit_Match(self, node: py.Match) -> py.Match:
+        node.bind = self.visit(node.bind)
+
+        # Patterns are only normalized: simplifying one (a + 0 into a) would make a binder
+        #   of what's no valid pattern, accepting programs the plain compiler rejects
+        optimize = self._optimize
+        self._optimize = False
+        try:
+            node.target = self.visit(node.target)
+        finally:
+            self._optimize = optimize
+
+        return node
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.expr:
+        self.generic_visit(node)
+        if not self._optimize:
+            return node
+
+        (lhs, rhs) = (IRTransformer.__number(node.left), IRTransformer.__number(node.right))
+        op = type(node.op)
+
+        if lhs is not None and rhs is not None:
+            if op is ast.Div and rhs == 0:
+                return node         # ...left to raise at runtime
+
+            return IRTransformer.__literal(IRTransformer.__BINARY_OPS[op](lhs, rhs), node.left)
+
+        if (op is ast.Mult and IRTransformer.__is_int(rhs, 1)) or \
+           (op in (ast.Add, ast.Sub) and IRTransformer.__is_int(rhs, 0)):
+            return node.left
+
+        if (op is ast.Mult and IRTransformer.__is_int(lhs, 1)) or \
+           (op is ast.Add and IRTransformer.__is_int(lhs, 0)):
+            return node.right
+
+        return node
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.expr:
+        self.generic_visit(node)
+        if not self._optimize:
+            return node
+
+        val = IRTransformer.__number(node.operand)
+        if val is None:
+            return node
+
+        return IRTransformer.__literal(IRTransformer.__UNARY_OPS[type(node.op)](val), node.operand)
+
+    def visit_Do(self, node: py.Do) -> ast.expr:
+        self.generic_visit(node)
+        if not self._optimize:
+            return node
+
+        body = node.body
+        if len(body) == 1 and isinstance(body[0], (py.FlInteger, py.FlAtom, ast.Constant)):
+            return body[0]
+
+        return node
+
+    @staticmethod
+    def __copy(node: typing.Any) -> typing.Any:
+        """
+        :return: a copy of the tree under 'node' - its nodes, and the lists and tuples
+             holding them, with the scalars in them shared
+        """
+        if isinstance(node, list):
+            return [IRTransformer.__copy(item) for item in node]
+        if isinstance(node, tuple):
+            return tuple(IRTransformer.__copy(item) for item in node)
+        if not isinstance(node, ast.AST):
+            return node
+
+        cls = type(node)
+        copied = cls.__new__(cls)
+
+        for attr in IRTransformer.__slots_of(cls):
+            try:
+                setattr(copied, attr, IRTransformer.__copy(getattr(node, attr)))
+            except AttributeError:      # ...never set
+                pass
+
+        for (attr, val) in node.__dict__.items():
+            setattr(copied, attr, IRTransformer.__copy(val))
+
+        return copied
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def __slots_of(cls: type) -> typing.Tuple[str, ...]:
+        return tuple(attr for base in cls.__mro__ for attr in getattr(base, '__slots__', ())
+                     if attr not in ('__dict__', '__weakref__'))
+
+    @staticmethod
+    def __number(node: ast.AST) -> typing.Optional[_Number]:
+        """
+        :return: the value of a numeric literal - None for anything else
+        """
+        if isinstance(node, py.FlInteger):
+            return node.value
+
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return node.value
+
+        return None
+
+    @staticmethod
+    def __literal(val: _Number, origin: ast.AST) -> ast.expr:
+        """
+        :return: the node for a folded 'val' - divisions give floats, which have no
+             literal of their own, so those end up as plain ast.Constants
+        """
+        node = py.FlInteger(val) if type(val) is int else ast.Constant(val)
+        node.offset = getattr(origin, 'offset', None)
+
+        return node
+
+    @staticmethod
+    def __is_int(val: typing.Optional[_Number], expected: int) -> bool:
+        return type(val) is int and val == expected      # x*1.0 turns an int x into a float
+
+
+class DeadCodeEliminator(ast.NodeTransformer):
+    """
+    Drops what a do block computes but nothing ever observes:
+        - the side-effect free expressions in its head - literals, symbols, and collections
+            or arithmetic made of those (arithmetic assumes numbers, as IRTransformer does,
+            but a division is kept - dividing by zero raises - unless it's of two
+            literals, by a non-zero one)
+        - the bindings no later expression reads - a match with a plain symbol for target
+            is replaced by the expression it binds, and in patterns the variables that
+            aren't read are turned into wildcards
+
+    It runs ahead of scope analysis, so reads are tracked by name: a variable counts as
+        read when its name is read anywhere past the binding - even by a block shadowing
+        it, which only ever keeps more. The top-level bindings are the module's exports,
+        and are always kept
+    """
+    __slots__ = ('_reads', '_bindings')
+    _reads: typing.Dict[str, int]       # name -> when it's last read, in evaluation order
+    _bindings: typing.Dict[int, int]    # id() of a pattern's Symbol -> when it's bound
+
+    __WILDCARD = '_'
+
+    # The operators that can't raise, given numbers
+    __TOTAL_OPS = (ast.Add, ast.Sub, ast.Mult)
+
+    def __init__(self, tree: ast.AST):
+        self._reads = {}
+        self._bindings = {}
+
+        self.__order(tree, itertools.count(1))
+
+    def visit_Do(self, node: py.Do) -> py.Do:
+        self.generic_visit(node)
+
+        body = [self.__drop_dead_binding(expr) for expr in node.body]
+
+        head = [expr for expr in body[:-1] if not DeadCodeEliminator.__is_pure(expr)]
+        node.body[:] = head + body[-1:]
+
+        return node
+
+    def visit_CompilationUnit(self, node: py.CompilationUnit) -> py.CompilationUnit:
+        self.generic_visit(node)
+
+        body = node.body
+        body[:-1] = [expr for expr in body[:-1] if not DeadCodeEliminator.__is_pure(expr)]
+
+        return node
+
+    def __drop_dead_binding(self, expr: ast.AST) -> ast.AST:
+        if not isinstance(expr, py.Match):
+            return expr
+
+        target = expr.target.pattern
+
+        if isinstance(target, py.Symbol):
+            return expr.bind.pattern if self.__is_dead(target) else expr
+
+        binders = [node for node in ast.walk(target) if isinstance(node, py.Symbol)]
+        counts = collections.Counter(binder.name for binder in binders)
+
+        for binder in binders:
+            if counts[binder.name] == 1 and self.__is_dead(binder):     # ...one bound twice is an equality test
+                binder.symbol = DeadCodeEliminator.__WILDCARD
+
+        return expr
+
+    def __is_dead(self, binder: py.Symbol) -> bool:
+        return self._reads.get(binder.name, 0) < self._bindings[id(binder)]
+
+    def __order(self, node: ast.AST, clock: typing.Iterator[int]):
+        """
+        Timestamps the tree's reads and bindings, in the order they're evaluated in
+        """
+        if isinstance(node, py.Symbol):
+            self._reads[node.name] = next(clock)
+
+        elif isinstance(node, py.Match):
+            self.__order(node.bind.pattern, clock)      # the bound value comes first
+
+            for binder in ast.walk(node.target.pattern):
+                if isinstance(binder, py.Symbol):
+                    self._bindings[id(binder)] = next(clock)
+
+        else:
+            for child in ast.iter_child_nodes(node):
+                self.__order(child, clock)
+
+    @staticmethod
+    def __is_pure(node: ast.AST) -> bool:
+        if isinstance(node, (py.FlInteger, py.FlAtom, py.FlString, ast.Constant, py.Symbol)):
+            return True
+
+        if isinstance(node, (py.FlList, py.FlTuple)):
+            return all(map(DeadCodeEliminator.__is_pure, node.value))
+
+        if isinstance(node, ast.BinOp):
+            if not isinstance(node.op, DeadCodeEliminator.__TOTAL_OPS) and \
+               not DeadCodeEliminator.__is_safe_division(node):
+                return False
+
+            return DeadCodeEliminator.__is_pure(node.left) and DeadCodeEliminator.__is_pure(node.right)
+
+        if isinstance(node, ast.UnaryOp):
+            return DeadCodeEliminator.__is_pure(node.operand)
+
+        if isinstance(node, py.Do):
+            return all(map(DeadCodeEliminator.__is_pure, node.body))
+
+        return False
+
+    @staticmethod
+    def __is_safe_division(node: ast.BinOp) -> bool:
+        literals = (py.FlInteger, ast.Constant)
+
+        return isinstance(node.op, ast.Div) and \
+            isinstance(node.left, literals) and isinstance(node.right, literals) and \
+            type(node.left.value) in (int, float) and type(node.right.value) in (int, float) and \
+            node.right.value != 0
@@ -0,0 +1,177 @@
+import os
+import types
+import typing
+
+from .lexer import Lexer
+from .parser import Parser
+from .source import Source, SourceBuffer, opened_source
+from .tree import ParseTreesData
+from .tablecache import ParseTableCache
+from .codetransform import IRTransformer
+from .codegen import CodeGen
+from .codecache import CodeCache
+from .instrument import Profiler, FileProfile
+
+
+class Compiler:
+    """
+    The whole pipeline, from source to code object:
+        Lexer -> Parser -> IRTransformer -> CodeGen -> compile()
+
+    Building the parser is the costly part of it, so a Compiler is meant to be reused -
+        its lexer and parser are built once, then shared by all the sources it compiles.
+
+    Given a CodeCache, sources compiled before (by any Compiler sharing its directory)
+        skip the whole pipeline, their code loaded from the cache instead.
+
+    Given a Profiler, each phase of every compile() is timed and measured
+    """
+    __slots__ = ('_lexer', '_parser', '_code_cache', '_grammar_hash', '_optimize', '_profiler')
+    _lexer: Lexer
+    _parser: Parser
+    _code_cache: typing.Optional[CodeCache]
+    _grammar_hash: typing.Optional[str]
+    _optimize: bool             # run IRTransformer's optimizations
+    _profiler: typing.Optional[Profiler]
+
+    def __init__(self, *, table_cache: typing.Optional[ParseTableCache] = None,
+                 code_cache: typing.Optional[CodeCache] = None, optimize: bool = True,
+                 profiler: typing.Optional[Profiler] = None):
+        self._lexer = Lexer(Lexer.REGEX)
+        self._parser = Parser(table_cache=table_cache)
+
+        self._code_cache = code_cache
+        self._grammar_hash = None
+        self._optimize = optimize
+        self._profiler = profiler
+
+    @property
+    def grammar_hash(self) -> str:
+        """
+        :return: the hash of the grammar the sources are parsed with - along with
+             CodeGen.VERSION, it keys whatever caches the generated code
+        """
+        if self._grammar_hash is None:
+            self._grammar_hash = Parser.grammar().hash()
+
+        return self._grammar_hash
+
+    @property
+    def key(self) -> str:
+        """
+        :return: identifies the code this Compiler generates - which only ever changes
+             along with it
+        """
+        return f"{CodeGen.VERSION}-{self.grammar_hash}" + ('' if self._optimize else '-noopt')
+
+    @property
+    def profiler(self) -> typing.Optional[Profiler]:
+        return self._profiler
+
+    def compile(self, source: Source, filename: typing.Optional[str] = None) -> types.CodeType:
+        """
+        :param source: see Lexer.lex()
+        :param filename: shown in tracebacks - the path itself by default, when 'source' is one
+
+        :return: the code object for 'source', the value of its last expression left
+             in CodeGen.RESULT when it's run
+        """
+        if filename is None:
+            filename = os.fspath(source) if isinstance(source, os.PathLike) else '<fluorite>'
+
+        with opened_source(source) as buffer:       # ...only needed until the code is generated
+            return self.__compile_source(buffer, filename)
+
+    @property
+    def trees(self) -> ParseTreesData:
+        """
+        :return: the trees built by the last compile() - that wasn't served by the CodeCache
+        """
+        return self._parser.trees
+
+    def __compile_source(self, source: SourceBuffer, filename: str) -> types.CodeType:
+        profile = self._profiler.file(filename) if self._profiler is not None else None
+
+        if self._code_cache is None:
+            return self.__compile(source, filename, profile)
+
+        source_hash = CodeCache.source_hash(source)
+        key = self.key          # ...hashing the grammar the first time, which isn't part of the 'cache' phase
+
+        if profile is None:
+            code = self._code_cache.load(source_hash, key, filename)
+        else:
+            with profile.phase('cache'):
+                code = self._code_cache.load(source_hash, key, filename)
+
+        if code is None:
+            code = self.__compile(source, filename, profile)
+            self._code_cache.store(source_hash, key, code)
+
+        return code
+
+    def __compile(self, source: SourceBuffer, filename: str, profile: typing.Optional[FileProfile]) -> types.CodeType:
+        if profile is not None:
+            return self.__compile_profiled(source, filename, profile)
+
+        tokens = self._lexer.tokenize(source)
+        tokens.lines.line_starts        # ...indexed while the source is open: errors' positions outlive it
+        trees = self._parser.parse(tokens).trees
+
+        trees.ir_tree = IRTransformer(trees.source_tree, optimize=self._optimize).transform()
+
+        codegen = CodeGen(trees.ir_tree, filename=filename, lines=tokens.lines)
+        trees.py_tree = codegen.module
+
+        return codegen.code
+
+    def __compile_profiled(self, source: SourceBuffer, filename: str, profile: FileProfile) -> types.CodeType:
+        """
+        __compile(), each phase measured into 'profile'
+        """
+        profiler = self._profiler
+
+        with profile.phase('lex') as phase:
+            tokens = self._lexer.tokenize(source)
+            tokens.lines.line_starts
+        phase.items = len(tokens)
+
+        with profile.phase('parse') as phase:
+            trees = self._parser.parse(tokens).trees
+        phase.items = profiler.nodes(trees.source_tree)     # ...counting isn't part of the phase
+
+        with profile.phase('transform') as phase:
+            trees.ir_tree = IRTransformer(trees.source_tree, optimize=self._optimize).transform()
+        phase.items = profiler.nodes(trees.ir_tree)
+
+        with profile.phase('codegen') as phase:
+            codegen = CodeGen(trees.ir_tree, filename=filename, lines=tokens.lines)
+            trees.py_tree = codegen.module
+        phase.items = profiler.nodes(trees.py_tree)
+
+        with profile.phase('compile'):
+            code = codegen.code
+
+        return code
+
+
+__compiler: typing.Optional[Compiler] = None
+
+
+def default_compiler() -> Compiler:
+    """
+    :return: the process-wide Compiler, built on first use
+    """
+    global __compiler
+
+    if __compiler is None:
+        __compiler = Compiler()
+
+    return __compiler
+
+
+def compile_source(source: Source, filename: typing.Optional[str] = None) -> types.CodeType:
+    """
+    Compiles 'source' with the process-wide Compiler - see Compiler.compile()
+    """
+    return default_compiler().compile(source, filename)
@@ -0,0 +1,10 @@
+import typing
+
+
+class CompileError(Exception):
+    """ An error in a Fluorite program, caught past the lexer and parser """
+    def __init__(self, message: str, offset: typing.Optional[int] = None):
+        self.message = message
+        self.offset = offset        # into the source, when known
+
+        super().__init__(message)
@@ -0,0 +1,73 @@
+import json
+import hashlib
+import typing
+
+
+class Grammar:
+    """
+    The productions and precedence table making up a grammar, declared through the same
+        '@production(...)' decorator rply.ParserGenerator has - but without importing or
+        running rply's generator until LALR tables actually have to be built
+    """
+    Production = typing.Tuple[str, typing.List[str], typing.Callable, typing.Optional[str]]
+    Precedence = typing.Tuple[str, typing.List[str]]
+
+    __slots__ = ('tokens', 'precedence', 'productions')
+    tokens: typing.Iterable[str]
+    precedence: typing.List[Precedence]
+    productions: typing.List[Production]
+
+    def __init__(self, tokens: typing.Iterable[str], precedence: typing.List[Precedence] = ()):
+        self.tokens = tokens
+        self.precedence = list(precedence)
+        self.productions = []
+
+    def production(self, rule: str, precedence: typing.Optional[str] = None):
+        """
+        :param rule: 'name : SYM sym ... | SYM ...', exactly as rply.ParserGenerator.production() takes it
+        """
+        (name, colon, *body) = rule.split()
+        assert colon == ':', f"expected ':' after the production name in '{rule}'"
+
+        def register(func: typing.Callable):
+            for prod in ' '.join(body).split('|'):
+                self.productions.append((name, prod.split(), func, precedence))
+
+            return func
+
+        return register
+
+    @property
+    def funcs(self) -> typing.List[typing.Optional[typing.Callable]]:
+        """
+        :return: the semantic actions indexed by production number, with 0 being
+             the augmented start production (which never gets reduced)
+        """
+        return [None] + [func for (_name, _syms, func, _prec) in self.productions]
+
+    def hash(self) -> str:
+        """
+        :return: a digest of the terminals, precedence table and productions - i.e.
+             everything the LALR tables are derived from
+        """
+        h = hashlib.sha1()
+        h.update(json.dumps(sorted(self.tokens)).encode())
+
+        for (assoc, terms) in self.precedence:
+            h.update(json.dumps([assoc, terms]).encode())
+
+        for (name, syms, _func, precedence) in self.productions:
+            h.update(json.dumps([name, syms, precedence]).encode())
+
+        return h.hexdigest()
+
+    def generator(self):
+        """
+        :return: an rply.ParserGenerator equivalent to this Grammar
+        """
+        import rply        # only needed when the tables have to be (re)built
+
+        pg = rply.ParserGenerator(self.tokens, precedence=self.precedence)
+        pg.productions.extend(self.productions)     # same (name, syms, func, precedence) layout
+
+        return pg
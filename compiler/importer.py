@@ -0,0 +1,116 @@
+import functools
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import types
+import typing
+
+import fluorite.runtime
+
+from .parser import Parser
+from .codegen import CodeGen
+from .driver import default_compiler
+
+
+class FluoriteLoader(importlib.machinery.SourceFileLoader):
+    """
+    Loads .fl modules through importlib's SourceLoader machinery: get_code() checks the
+        module's cached bytecode against the source's mtime and size, only compiling
+        the source (see source_to_code()) when it's stale, and then writing it back.
+
+    The cached bytecode is also keyed by the compiler - its file in __pycache__ is
+        named after CodeGen.VERSION and the grammar hash, so upgrading the compiler never
+        runs code generated by an older one (nor does it clash with a same-named .py's)
+    """
+    def exec_module(self, module: types.ModuleType):
+        super().exec_module(module)
+
+        fluorite.runtime.invalidate(module.__name__)    # ...when reloaded, the calls into it must see the new code
+
+    def source_to_code(self, data: bytes, path: str, *, _optimize: int = -1) -> types.CodeType:
+        return default_compiler().compile(data, path)
+
+    def get_data(self, path: str) -> bytes:
+        return super().get_data(self.__bytecode_path(path))
+
+    def set_data(self, path: str, data: bytes, *, _mode: int = 0o666):
+        return super().set_data(self.__bytecode_path(path), data, _mode=_mode)
+
+    def __bytecode_path(self, path: str) -> str:
+        """
+        :return: 'path' - unless it's the one the standard machinery caches our bytecode
+             at, in which case the compiler-specific path in its place
+        """
+        if path != importlib.util.cache_from_source(self.path):
+            return path
+
+        (cache_dir, _) = os.path.split(path)
+        stem = os.path.basename(self.path)[:-len(FluoriteFinder.SUFFIX)]
+
+        return os.path.join(cache_dir, f"{stem}.{FluoriteLoader.__compiler_tag()}.{sys.implementation.cache_tag}.pyc")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def __compiler_tag() -> str:
+        # ...just the grammar's hash - loading cached bytecode never builds the parser itself
+        return f"fl-{CodeGen.VERSION}-{Parser.grammar().hash()[:12]}"
+
+
+class FluoriteFinder(importlib.machinery.FileFinder):
+    """
+    The standard FileFinder, finding Fluorite modules too - 'Foo.Bar' being either
+        Foo/Bar.fl or Foo/Bar/__init__.fl under a sys.path entry (or its parent package's
+        path) - installed by install() as a sys.path_hooks entry. Each directory's
+        listing is cached, only read again when its mtime changes, so imports of
+        anything else pay nothing for it.
+
+    It stands in for the standard finder of every directory, so it finds the standard
+        modules there as well - the .fl ones first, like a .py would be if it came first
+    """
+    SUFFIX = '.fl'
+
+    @staticmethod
+    def loaders() -> typing.List[typing.Tuple[type, typing.List[str]]]:
+        """
+        :return: the (loader, suffixes) pairs the finder looks modules up with - the
+             standard ones, after FluoriteLoader's
+        """
+        return [
+            (FluoriteLoader,                            [FluoriteFinder.SUFFIX]),
+            (importlib.machinery.ExtensionFileLoader,   importlib.machinery.EXTENSION_SUFFIXES),
+            (importlib.machinery.SourceFileLoader,      importlib.machinery.SOURCE_SUFFIXES),
+            (importlib.machinery.SourcelessFileLoader,  importlib.machinery.BYTECODE_SUFFIXES),
+        ]
+
+
+__path_hook: typing.Optional[typing.Callable[[str], FluoriteFinder]] = None
+
+
+def install() -> typing.Callable[[str], FluoriteFinder]:
+    """
+    Makes .fl modules importable - idempotent, the same path hook is only ever installed
+        once. It goes first on sys.path_hooks, and the finders already cached for sys.path
+        entries are dropped, for it to take over from the standard ones
+
+    :return: the path hook, making a FluoriteFinder of a directory
+    """
+    global __path_hook
+
+    if __path_hook is None:
+        __path_hook = FluoriteFinder.path_hook(*FluoriteFinder.loaders())
+
+    if __path_hook not in sys.path_hooks:
+        sys.path_hooks.insert(0, __path_hook)
+        sys.path_importer_cache.clear()
+
+    return __path_hook
+
+
+def uninstall():
+    if __path_hook in sys.path_hooks:
+        sys.path_hooks.remove(__path_hook)
+
+        for (entry, finder) in list(sys.path_importer_cache.items()):
+            if isinstance(finder, FluoriteFinder):
+                del sys.path_importer_cache[entry]
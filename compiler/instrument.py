@@ -0,0 +1,150 @@
+import ast
+import json
+import time
+import tracemalloc
+import typing
+
+
+class PhaseStats:
+    """
+    What one phase of the pipeline took, for one file: its wall time, the size of what
+        it produced (tokens for the lexer, tree nodes for the others) and - while
+        tracemalloc is tracing - the peak of the memory it allocated
+    """
+    __slots__ = ('name', 'seconds', 'items', 'peak_bytes')
+    name: str
+    seconds: float
+    items: typing.Optional[int]
+    peak_bytes: typing.Optional[int]
+
+    def __init__(self, name: str, seconds: float, items: typing.Optional[int] = None,
+                 peak_bytes: typing.Optional[int] = None):
+        self.name = name
+        self.seconds = seconds
+        self.items = items
+        self.peak_bytes = peak_bytes
+
+    def to_json(self) -> typing.Dict[str, typing.Any]:
+        return {'phase': self.name, 'seconds': self.seconds, 'items': self.items, 'peak_bytes': self.peak_bytes}
+
+
+class FileProfile:
+    """ The phases one file went through, in order """
+    __slots__ = ('path', 'phases')
+    path: str
+    phases: typing.List[PhaseStats]
+
+    def __init__(self, path: str):
+        self.path = path
+        self.phases = []
+
+    @property
+    def seconds(self) -> float:
+        return sum(phase.seconds for phase in self.phases)
+
+    def phase(self, name: str) -> 'PhaseTimer':
+        """
+        :return: the context manager timing the phase 'name' - entering it gives the
+             phase's PhaseStats, for setting its 'items'
+        """
+        return PhaseTimer(self, name)
+
+    def to_json(self) -> typing.Dict[str, typing.Any]:
+        return {'path': self.path, 'seconds': self.seconds, 'phases': [phase.to_json() for phase in self.phases]}
+
+
+class PhaseTimer:
+    __slots__ = ('_stats', '_start', '_start_bytes')
+    _stats: PhaseStats
+    _start: float
+    _start_bytes: typing.Optional[int]
+
+    def __init__(self, profile: FileProfile, name: str):
+        self._stats = PhaseStats(name, 0.0)
+        profile.phases.append(self._stats)
+
+    def __enter__(self) -> PhaseStats:
+        self._start_bytes = None
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self._start_bytes = tracemalloc.get_traced_memory()[0]
+
+        self._start = time.perf_counter()
+
+        return self._stats
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stats.seconds = time.perf_counter() - self._start
+
+        if self._start_bytes is not None:
+            self._stats.peak_bytes = max(0, tracemalloc.get_traced_memory()[1] - self._start_bytes)
+
+
+class Profiler:
+    """
+    Collects a FileProfile for every file a Compiler given it compiles - see
+        Compiler.compile(). Only timing is always on: peak allocations are recorded
+        while tracemalloc is tracing (which slows down allocation a lot), and the
+        trees' nodes are only counted when 'count_nodes'
+    """
+    __slots__ = ('files', '_count_nodes')
+    files: typing.List[FileProfile]
+    _count_nodes: bool
+
+    def __init__(self, *, count_nodes: bool = True):
+        self.files = []
+        self._count_nodes = count_nodes
+
+    def file(self, path: str) -> FileProfile:
+        profile = FileProfile(path)
+        self.files.append(profile)
+
+        return profile
+
+    def take(self) -> typing.List[FileProfile]:
+        """
+        :return: the files profiled so far - which the Profiler then forgets
+        """
+        (files, self.files) = (self.files, [])
+
+        return files
+
+    def nodes(self, tree: ast.AST) -> typing.Optional[int]:
+        if not self._count_nodes:
+            return None
+
+        return sum(1 for _ in ast.walk(tree))
+
+    @staticmethod
+    def report(files: typing.Iterable[FileProfile]) -> str:
+        """
+        :return: a table of the phases of 'files', the slowest files first - followed by
+             each phase's total, over all of them
+        """
+        files = sorted(files, key=lambda file: file.seconds, reverse=True)
+
+        lines = [f"{'ms':>9}  {'phase':<10} {'items':>9} {'peak KiB':>9}  file"]
+        totals: typing.Dict[str, typing.List[float]] = {}
+
+        for file in files:
+            lines.append(f"{file.seconds * 1e3:>9.2f}  {'':<10} {'':>9} {'':>9}  {file.path}")
+
+            for phase in file.phases:
+                items = phase.items if phase.items is not None else '-'
+                peak = f"{phase.peak_bytes / 1024:.1f}" if phase.peak_bytes is not None else '-'
+                lines.append(f"{phase.seconds * 1e3:>9.2f}  {phase.name:<10} {items:>9} {peak:>9}")
+
+                total = totals.setdefault(phase.name, [0.0, 0])
+                total[0] += phase.seconds
+                total[1] += phase.items or 0
+
+        lines.append('')
+        lines.append(f"{'ms':>9}  {'phase':<10} {'items':>9}  (total, over {len(files)} files)")
+        for (name, (seconds, items)) in sorted(totals.items(), key=lambda total: total[1][0], reverse=True):
+            lines.append(f"{seconds * 1e3:>9.2f}  {name:<10} {items:>9}")
+
+        return '\n'.join(lines)
+
+    @staticmethod
+    def to_json(files: typing.Iterable[FileProfile]) -> str:
+        return json.dumps([file.to_json() for file in files], indent=2)
@@ -1,10 +1,12 @@
 import rply
 
 import re
-import itertools
-import functools
 import typing
 
+from .relexer import RegexLexer
+from .tokenbuf import TokenBuffer
+from .source import Source, SourceBuffer, open_source, decode
+
 
 class TokenTag:
     NUM = "NUM"
@@ -57,6 +59,8 @@ Token = rply.token.Token
 
 class Lexer:
     __BAR = '|'
+    __SYNTHETIC = r"(?=.)$"     # can never match - for tags the lexer mustn't produce
+
     TOKENS = [
         (TokenTag.NUM, r"\d+"),
 
@@ -92,39 +96,108 @@ class Lexer:
         # Inserted by a transform on the token stream,
         #   as it is dependant on surrounding tokens
         #   and the whitespace (or lack thereof) between
-        (TokenTag.FNAPPLY, r"(?=.)$"),
+        (TokenTag.FNAPPLY, __SYNTHETIC),
 
         # Synthetic tokens for precedence table
-        (TokenTag.UNARYOP, r"(?=.)$"),
+        (TokenTag.UNARYOP, __SYNTHETIC),
 
-        (TokenTag.NOPARENSAPPLY, r"(?=.)$"),
-        (TokenTag.PARENSAPPLY, r"(?=.)$"),
-        (TokenTag.UNARYAPPLY, r"(?=.)$"),
+        (TokenTag.NOPARENSAPPLY, __SYNTHETIC),
+        (TokenTag.PARENSAPPLY, __SYNTHETIC),
+        (TokenTag.UNARYAPPLY, __SYNTHETIC),
 
         # --- Internal ---
-        (__BAR, r"(?=.)$"),
+        (__BAR, __SYNTHETIC),
     ]
 
     TOKEN_TAGS = dict(TOKENS).keys()    # stores all the TokenTags
 
+    __TAG_NAMES = list(TOKEN_TAGS)                               # TokenBuffer tag id -> TokenTag
+    __TAG_IDS = {tag: tag_id for (tag_id, tag) in enumerate(TOKEN_TAGS)}
+
     _LEADING_WHITESPACE  = re.compile(r"^\s+")
     _TRAILING_WHITESPACE = re.compile(r"\s+$")
 
     _COMMENT = re.compile(r"#[^\n]*")
 
-    __slots__ = ('_lexer', )
-    _lexer: rply.lexer.Lexer
+    IGNORE = [
+        _LEADING_WHITESPACE,
+        re.compile(r"[ \t]+"),
+        _COMMENT,
+        # re.compile(r"(?<=\s)[ \t]+(?=\n\s+)[ \t\n]+"),
+        _TRAILING_WHITESPACE,
+    ]
+
+    # Lexer backends
+    RPLY  = 'rply'      # rply.lexer.Lexer, trying every rule in turn
+    REGEX = 'regex'     # relexer.RegexLexer, trying all rules at once
 
-    def __init__(self):
-        self._lexer = Lexer.__build_lexer()
+    BACKENDS = (RPLY, REGEX)
+
+    # Tokens which, when directly following an ID, make it a no-parens function application
+    __FNAPPLY_ARGS = frozenset({
+        TokenTag.ID, TokenTag.ATOM, TokenTag.KW,
+        TokenTag.NUM,
+        # TokenTag.PLUS, TokenTag.MINUS,              # unary ops
+        TokenTag.LBRACE, TokenTag.LSQRBRACKET,      # collection literals
+    })
+
+    __slots__ = ('_lexer', )
+    _lexer: typing.Union[rply.lexer.Lexer, RegexLexer]
+
+    def __init__(self, backend: str = RPLY):
+        assert backend in Lexer.BACKENDS, f"unknown Lexer backend '{backend}'"
+
+        if backend == Lexer.REGEX:
+            self._lexer = Lexer.__build_regex_lexer()
+        else:
+            self._lexer = Lexer.__build_lexer()
+
+    def lex(self, source: Source) -> typing.Iterator[Token]:
+        """
+        :param source: the program text - or a UTF-8 encoded buffer of it (bytes, mmap),
+             or the path to a file containing it. These are lexed via 'tokenize()',
+             so their tokens' text is only decoded as it's read
+        """
+        if not isinstance(source, str):
+            yield from self.tokenize(source)
+            return
 
-    def lex(self, source: str) -> rply.lexer.LexerStream:
         stream = self._lexer.lex(source)
 
-        toks1, toks2 = itertools.tee(itertools.chain(stream, [None]))
-        next(toks2, None)
+        yield from Lexer.__insert_fnapply(stream)
+
+    def tokenize(self, source: Source) -> TokenBuffer:
+        """
+        :return: the same tokens 'lex(source)' yields, packed into a TokenBuffer
+        """
+        source = open_source(source)
+        if not isinstance(source, str) and not isinstance(self._lexer, RegexLexer):
+            source = decode(source[:])          # rply can only lex text...
+
+        buf = TokenBuffer(source, Lexer.__TAG_NAMES)
+        tag_ids = Lexer.__TAG_IDS
+
+        (fnapply, lf) = (tag_ids[TokenTag.FNAPPLY], tag_ids[TokenTag.LF])
 
-        yield from functools.reduce(Lexer.__insert_fnapply, zip(toks1, toks2), [])
+        (prev_tag, prev_end) = (None, 0)
+        for (tag, start, end) in self.__spans(source):
+            if prev_tag == TokenTag.LF:
+                buf.lengths[-1] = 0         # blank out the LF's matched whitespace
+            elif Lexer.__fnapply_between(prev_tag, prev_end, tag, start):
+                buf.append(fnapply, prev_end, 0)
+
+            buf.append(tag_ids[tag], start, end - start)
+
+            (prev_tag, prev_end) = (tag, end)
+
+        return buf
+
+    def __spans(self, source: SourceBuffer) -> typing.Iterator[typing.Tuple[str, int, int]]:
+        if isinstance(self._lexer, RegexLexer):
+            return self._lexer.spans(source)
+
+        return ((tok.name, tok.source_pos.idx, tok.source_pos.idx + len(tok.value))
+                for tok in self._lexer.lex(source))
 
     @classmethod
     def tokens_list(cls):
@@ -137,44 +210,58 @@ class Lexer:
         for tok, exp in cls.TOKENS:
             lg.add(tok, exp)
 
-
-        lg.ignore(Lexer._LEADING_WHITESPACE)
-        lg.ignore(re.compile(r"[ \t]+"))
-        lg.ignore(Lexer._COMMENT)
-        # lg.ignore(re.compile(r"(?<=\s)[ \t]+(?=\n\s+)[ \t\n]+"))
-        lg.ignore(Lexer._TRAILING_WHITESPACE)
+        for exp in cls.IGNORE:
+            lg.ignore(exp)
 
         return lg.build()
 
+    @classmethod
+    def __build_regex_lexer(cls):
+        live_tokens = [(tok, exp) for (tok, exp) in cls.TOKENS if exp != Lexer.__SYNTHETIC]
+
+        return RegexLexer(live_tokens, [exp.pattern for exp in cls.IGNORE])
+
     @staticmethod
-    def __insert_fnapply(toks_out: typing.List[Token],
-                         t: typing.Tuple[Token, typing.Union[Token, None]]):
-        (token, lookahead) = t
-        # print(f"{len(toks_out)}: ({token}, {lookahead})")
+    def __insert_fnapply(stream: typing.Iterator[Token]) -> typing.Iterator[Token]:
+        """
+        Rewrites the raw token stream in a single pass, holding on to just the
+            one token of lookahead needed to decide whether a FNAPPLY goes
+            between two tokens (and to blank out the LFs' matched whitespace)
 
-        if lookahead is None:       # None is used as end of stream marker
-            return toks_out + [token]
+        :return: an Iterator yielding each token as soon as its successor is known
+        """
+        token = next(stream, None)
+        if token is None:
+            return
 
-        (tok_type, lahead_type) = (token.gettokentype(), lookahead.gettokentype())
+        for lookahead in stream:
+            tok_type = token.gettokentype()
 
-        tok_fnapply = Token(TokenTag.FNAPPLY, '')
-        tok_lf      = Token(TokenTag.LF, '')
+            if tok_type == TokenTag.LF:
+                yield Token(TokenTag.LF, '')
+            else:
+                yield token
 
-        if (tok_type, lahead_type) == (TokenTag.ID, TokenTag.LPAREN):
-            token_pos, lookahead_pos = token.getsourcepos(), lookahead.getsourcepos()
+                (lahead_type, lahead_pos) = (lookahead.gettokentype(), lookahead.getsourcepos())
+                token_end = token.getsourcepos().idx + len(token.getstr()) if tok_type == TokenTag.ID else None
 
-            token_end = token_pos.idx + len(token.getstr())
+                if Lexer.__fnapply_between(tok_type, token_end, lahead_type, lahead_pos.idx):
+                    yield Token(TokenTag.FNAPPLY, '')
 
-            if token_end == lookahead_pos.idx:   # Insert a FNAPPLY when there is no space between the function name and '('
-                return toks_out + [token, tok_fnapply]
-        elif tok_type == TokenTag.ID and lahead_type in {
-                    TokenTag.ID, TokenTag.ATOM, TokenTag.KW,
-                    TokenTag.NUM,
-                    # TokenTag.PLUS, TokenTag.MINUS,              # unary ops
-                    TokenTag.LBRACE, TokenTag.LSQRBRACKET,      # collection literals
-        }:
-            return toks_out + [token, tok_fnapply]   #  ...and between two adjacent terms (no operator inbetween)
-        elif tok_type == TokenTag.LF:
-            return toks_out + [tok_lf]
+            token = lookahead
 
-        return toks_out + [token]
+        yield token     # the last token has no lookahead, so it's passed through as-is
+
+    @staticmethod
+    def __fnapply_between(tok_type: typing.Optional[str], tok_end: typing.Optional[int],
+                          lahead_type: str, lahead_start: int) -> bool:
+        """
+        :return: whether a FNAPPLY goes between a token and its lookahead
+        """
+        if tok_type != TokenTag.ID:
+            return False
+
+        if lahead_type == TokenTag.LPAREN:   # Insert a FNAPPLY when there is no space between the function name and '('
+            return tok_end == lahead_start
+
+        return lahead_type in Lexer.__FNAPPLY_ARGS     #  ...and between two adjacent terms (no operator inbetween)
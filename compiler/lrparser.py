@@ -0,0 +1,148 @@
+import rply
+
+import typing
+
+from .lexer import Token
+
+
+class ParseTables:
+    """
+    The action/goto tables of an LALR(1) automaton, in the form rply generates them:
+        'action[state][terminal]' is a shift to state N when N > 0, a reduction by
+        production -N when N < 0, and accept when 0
+    """
+    __slots__ = ('action', 'goto', 'default_reductions', 'productions')
+    action: typing.Sequence[typing.Mapping[str, int]]
+    goto: typing.Sequence[typing.Mapping[str, int]]
+    default_reductions: typing.Sequence[int]
+    productions: typing.Sequence[typing.Tuple[str, int]]     # (name, length) by production number
+
+    def __init__(self, action, goto, default_reductions, productions):
+        self.action = action
+        self.goto = goto
+        self.default_reductions = default_reductions
+        self.productions = productions
+
+    @classmethod
+    def from_lr_table(cls, lr_table) -> 'ParseTables':
+        """
+        :param lr_table: an rply.parsergenerator.LRTable
+        """
+        productions = [(p.name, p.getlength()) for p in lr_table.grammar.productions]
+
+        return cls(lr_table.lr_action, lr_table.lr_goto, lr_table.default_reductions, productions).canonical()
+
+    def canonical(self) -> 'ParseTables':
+        """
+        :return: the same automaton, numbered independently of how it was built - rply's
+             state numbers (and the order of the rows' symbols) follow set iteration
+             order, which changes with PYTHONHASHSEED. The states are renumbered in the
+             order they're first reached from the start state, following the symbols in
+             sorted order, and the rows are sorted
+        """
+        order = [0]
+        numbers = {0: 0}
+        for state in order:                     # (grows as states are reached)
+            successors = sorted(self.action[state].items()) + sorted(self.goto[state].items())
+
+            for (_, target) in successors:
+                if target > 0 and target not in numbers:
+                    numbers[target] = len(order)
+                    order.append(target)
+
+        for state in range(len(self.action)):   # ...any the start state never reaches, last
+            if state not in numbers:
+                numbers[state] = len(order)
+                order.append(state)
+
+        def shift(actions: typing.Mapping[str, int]) -> typing.Dict[str, int]:
+            return {sym: (numbers[act] if act > 0 else act) for (sym, act) in sorted(actions.items())}
+
+        def goto(gotos: typing.Mapping[str, int]) -> typing.Dict[str, int]:
+            return {sym: numbers[target] for (sym, target) in sorted(gotos.items())}
+
+        return ParseTables([shift(self.action[state]) for state in order],
+                           [goto(self.goto[state]) for state in order],
+                           [self.default_reductions[state] for state in order],
+                           self.productions)
+
+    def serialize(self) -> dict:
+        return {
+            'action': self.action,
+            'goto': self.goto,
+            'default_reductions': self.default_reductions,
+            'productions': self.productions,
+        }
+
+    @classmethod
+    def deserialize(cls, data: dict) -> 'ParseTables':
+        productions = [(name, length) for (name, length) in data['productions']]
+
+        return cls(data['action'], data['goto'], data['default_reductions'], productions)
+
+
+class LRParser:
+    """
+    Table-driven LR parser - a trimmed down rply.parser.LRParser, which runs off
+        plain ParseTables, so it never needs the rply.Grammar they were built from
+    """
+    __slots__ = ('_tables', '_funcs')
+    _tables: ParseTables
+    _funcs: typing.Sequence[typing.Optional[typing.Callable]]
+
+    def __init__(self, tables: ParseTables, funcs: typing.Sequence[typing.Optional[typing.Callable]]):
+        assert len(tables.productions) == len(funcs), 'ParseTables built for a different grammar!'
+
+        self._tables = tables
+        self._funcs = funcs
+
+    def parse(self, tokenizer: typing.Iterator[Token], state: typing.Any = None):
+        (action, goto) = (self._tables.action, self._tables.goto)
+        default_reductions = self._tables.default_reductions
+        productions = self._tables.productions
+        funcs = self._funcs
+
+        lookahead = None
+
+        statestack = [0]
+        symstack = [Token("$end", "$end")]
+
+        current_state = 0
+        while True:
+            t = default_reductions[current_state]
+            if not t:
+                if lookahead is None:
+                    lookahead = next(tokenizer, None)
+
+                    if lookahead is None:
+                        lookahead = Token("$end", "$end")
+
+                t = action[current_state].get(lookahead.gettokentype())
+                if t is None:
+                    raise rply.ParsingError(None, lookahead.getsourcepos())
+
+                if t > 0:       # shift
+                    statestack.append(t)
+                    current_state = t
+                    symstack.append(lookahead)
+                    lookahead = None
+                    continue
+                elif t == 0:    # accept
+                    return symstack[-1]
+
+            # reduce
+            (name, length) = productions[-t]
+            if length:
+                targ = symstack[-length:]
+
+                del symstack[-length:]
+                del statestack[-length:]
+            else:
+                targ = []
+
+            func = funcs[-t]
+            value = func(targ) if state is None else func(state, targ)
+
+            symstack.append(value)
+            current_state = goto[statestack[-1]][name]
+            statestack.append(current_state)
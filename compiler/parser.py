@@ -3,9 +3,14 @@ import ast
 import typing
 import itertools
 import functools
+import warnings
 
 from .lexer import TokenTag, Lexer
+from .source import Source, SOURCE_TYPES
 from .tree import ParseTreesData
+from .grammar import Grammar
+from .lrparser import ParseTables, LRParser
+from .tablecache import ParseTableCache
 
 import py
 
@@ -33,26 +38,49 @@ class OpAssoc:
 
 
 class Parser:
-    __slots__ = ('_parser', '_token_stream', '_tree')
+    __slots__ = ('_parser', '_lexer', '_token_stream', '_tree')
+    _lexer: typing.Optional[Lexer]              # Lexes the sources passed to parse() in place of tokens
     _token_stream: typing.Optional[_TokenStream]
     _tree: typing.Optional[ParseTreesData]     # Caches the result of a parse
 
-    def __init__(self, token_stream: _TokenStream = None):
-        self._parser = Parser.__build_parser()
+    def __init__(self, token_stream: _TokenStream = None, *,
+                 table_cache: typing.Optional[ParseTableCache] = None):
+        self._parser = Parser.__build_parser(table_cache if table_cache is not None else ParseTableCache())
+        self._lexer = None
         self._token_stream = token_stream
 
         self._tree = None
 
-    def parse(self, token_stream: typing.Iterable[_Token] = None):
+    def parse(self, token_stream: typing.Union[typing.Iterable[_Token], Source] = None):
+        """
+        :param token_stream: the tokens to parse - or a source (text, a UTF-8 buffer or
+             a file path, see Lexer.lex()), which then gets lexed into a TokenBuffer
+        """
         self._token_stream = token_stream if token_stream is not None else self._token_stream
 
-        assert self._token_stream, 'Parser.parse() called without source token stream assigned!'
+        if isinstance(self._token_stream, SOURCE_TYPES):
+            if self._lexer is None:
+                self._lexer = Lexer(Lexer.REGEX)
+
+            self._token_stream = self._lexer.tokenize(self._token_stream)
+
+        assert self._token_stream is not None, 'Parser.parse() called without source token stream assigned!'
 
         self._tree = ParseTreesData()
         self._parser.parse(iter(self._token_stream), state=self._tree)
 
         return self
 
+    @property
+    def trees(self) -> ParseTreesData:
+        """
+        :return: the trees of the last parse - the IR and Python ones get filled in by the
+             later compilation stages (see compiler.driver.Compiler)
+        """
+        assert self._tree is not None, 'Parser.trees accessed before any parse!'
+
+        return self._tree
+
     @property
     def tree(self) -> py.CompilationUnit:
         if self._tree is not None:
@@ -61,8 +89,38 @@ class Parser:
         return self.parse().tree     # cache the parse tree and return it...
 
     @classmethod
-    def __build_parser(cls):
-        pg = rply.ParserGenerator(
+    def __build_parser(cls, table_cache: ParseTableCache) -> LRParser:
+        grammar = cls.grammar()
+
+        return LRParser(Parser.__load_tables(grammar, table_cache), grammar.funcs)
+
+    @staticmethod
+    def __load_tables(grammar: Grammar, table_cache: ParseTableCache) -> ParseTables:
+        """
+        :return: the tables frozen into compiler/_parsetab.py when they're up-to-date
+             with 'grammar', otherwise the ones 'table_cache' has (or builds)
+        """
+        try:
+            from . import _parsetab
+        except ImportError:
+            _parsetab = None
+
+        if _parsetab is not None:
+            if _parsetab.GRAMMAR_HASH == grammar.hash():
+                return ParseTables(_parsetab.ACTION, _parsetab.GOTO,
+                                   _parsetab.DEFAULT_REDUCTIONS, _parsetab.PRODUCTIONS)
+
+            warnings.warn("compiler/_parsetab.py is out of date with the grammar, "
+                          "re-run 'python -m compiler.parsergen'", stacklevel=3)
+
+        return table_cache.tables(grammar)
+
+    @classmethod
+    def grammar(cls) -> Grammar:
+        """
+        :return: the Fluorite grammar - its productions and precedence table
+        """
+        pg = Grammar(
             Lexer.TOKEN_TAGS,
 
             precedence=[
@@ -104,10 +162,7 @@ class Parser:
         @pg.production(f"exprs : exprs ; expr-or-fn-apply")
         @pg.production(f"exprs : expr-or-fn-apply")
         def exprs_(_state, p: _ProdTermsTrees):
-            tail_expr = p[-1]
-            exprs_head = p[0] if p[0] is not tail_expr else []
-
-            return exprs_head + [tail_expr]
+            return Parser.__append_item(p)
 
         @pg.production(f"expr-or-fn-apply : expr")
         @pg.production(f"expr-or-fn-apply : match-expr")
@@ -127,17 +182,17 @@ class Parser:
 
         @pg.production(f"atom : {TokenTag.ATOM}")
         def atom_unqual(_state, p: _ProdTermsTokens):
-            return py.FlAtom(p[0].getstr())
+            return Parser.__at_token(py.FlAtom(p[0].getstr()), p[0])
 
         @pg.production(f"id : {TokenTag.ID}")
         def id_unqual(_state, p: _ProdTermsTokens):
-            return py.Symbol(p[0].getstr())
+            return Parser.__at_token(py.Symbol(p[0].getstr()), p[0])
 
         @pg.production(f"number : {TokenTag.NUM}")
         def number(_state, p: _ProdTermsTokens):
             tok_num = p[0].getstr()
 
-            return Parser.__build_const_node(int(tok_num), py.FlInteger)
+            return Parser.__at_token(Parser.__build_const_node(int(tok_num), py.FlInteger), p[0])
 
         @typing.overload
         @pg.production(f"expr : literal")
@@ -182,10 +237,7 @@ class Parser:
         @pg.production(f"tuple-items : tuple-items , expr-or-fn-apply")
         @pg.production(f"tuple-items : expr-or-fn-apply")
         def tuple_items(_state, p: _VariantList(_ProdTermsTrees, _Tree)):
-            tail_item: ast.expr = p[-1]
-            items_head: _ExprList = p[0] if p[0] is not p[-1] else []
-
-            return items_head + [tail_item]
+            return Parser.__append_item(p)
 
         @pg.production(f"list : list-open list-items list-close")
         def list_(_state, p: _ProdTermsTreeLists):
@@ -211,12 +263,7 @@ class Parser:
         @pg.production(f"list-items : list-items {TokenTag.LF} list-item")
         @pg.production(f"list-items : list-item")
         def list_items(_state, p: _ProdTermsTreeLists):
-            tail_item: ast.expr = p[-1]
-            items_head: _ExprList = p[0] if p[0] is not p[-1] else []
-
-            # print(f"list_items: tail_item={tail_item} items_head={items_head}")
-
-            return items_head + [tail_item]
+            return Parser.__append_item(p)
 
         @pg.production(f"list-item : expr-or-fn-apply")
         def list_item(_state, p: _ProdTermsTrees):
@@ -244,10 +291,7 @@ class Parser:
         @pg.production(f"keyword-list-items : keyword-list-items {TokenTag.LF} keyword-list-item")
         @pg.production(f"keyword-list-items : keyword-list-item")
         def keyword_list_items(_state, p: _ProdTermsTreeLists):
-            tail_item: ast.expr = p[-1]
-            items_head: _ExprList = p[0] if p[0] is not p[-1] else []
-
-            return items_head + [tail_item]
+            return Parser.__append_item(p)
 
         @pg.production(f"keyword-list-item : keyword")
         def keyword_list_item(_state, p: _ProdTermsTokens):
@@ -301,16 +345,13 @@ class Parser:
         @pg.production(f"fn-module : fn-module . atom")
         @pg.production(f"fn-module : atom")
         def fn_module(_state, p: _ProdTermsTreeLists):
-            path_tail: py.FlAtom = p[-1]
-            path_head: typing.List[py.FlAtom] = p[0] if p[0] is not p[-1] else []
-
-            return path_head + [path_tail]
+            return Parser.__append_item(p)
 
         @pg.production(f"fn-args : fn-args , fn-arg")
         @pg.production(f"fn-args : fn-arg")
         def fn_args(_state, p: typing.List[py.FlAtom]):
             # Concatenate all the arguments and filter out ','...
-            return p[0]+[p[-1]] if len(p) > 1 else [p[0]]
+            return Parser.__append_item(p)
 
         @pg.production(f"fn-arg : expr-or-fn-apply")
         def fn_arg(_state, p: _ProdTermsTokens):
@@ -338,16 +379,16 @@ class Parser:
         @pg.production(f"do-block : do-block-open exprs do-block-close")
         def do_block(_state, p: typing.Tuple[int, typing.List[ast.expr]]):
             exprs = p[1]
-            block = py.Do(exprs=exprs, tail_expr=(exprs[-1] if len(exprs) > 1 else None))
+            block = py.Do(exprs=exprs)
+            block.offset = p[0]
 
             return block
 
         @pg.production(f"do-block-open : {TokenTag.DO} {TokenTag.LF}")
         def do_block_open(_state, p: _ProdTermsTokens):
             tok_do = p[0]
-            tok_do_pos = tok_do.getsourcepos()
 
-            return tok_do_pos.idx       # Unique name
+            return tok_do.getsourcepos().idx        # ...becomes the Do's offset
 
         @pg.production(f"do-block-close : {TokenTag.LF} {TokenTag.END}")
         def do_block_close(_state, p: _ProdTermsTokens):
@@ -415,9 +456,37 @@ class Parser:
 
         #   ...and the resulting 'unused production' warning
         @pg.production(f"main : --synth-toks")
-        def __main(*args): ...          # The rply.Parser is guaranteed to NEVER reduce by this rule
+        def __main(*args): ...          # The LRParser is guaranteed to NEVER reduce by this rule
+
+        return pg
 
-        return pg.build()
+    @staticmethod
+    def __append_item(p: _ProdTermsTreeLists) -> _ExprList:
+        """
+        Reduces the 'items : items <separators...> item | item' left-recursive productions -
+            where the list built for 'items' gets the new tail appended in place, as nothing
+            else refers to it once it's been popped off the parser's stack
+
+        :return: the list of all the items so far
+        """
+        tail_item: ast.expr = p[-1]
+        if len(p) == 1:
+            return [tail_item]
+
+        items_head: _ExprList = p[0]
+        items_head.append(tail_item)
+
+        return items_head
+
+    @staticmethod
+    def __at_token(node: ast.AST, tok: _Token) -> ast.AST:
+        """
+        Stamps 'node' with the source offset of the token it was built from - the line
+            and column can be resolved from it with a compiler.source.LineIndex
+        """
+        node.offset = tok.getsourcepos().idx
+
+        return node
 
     @staticmethod
     def __build_const_node(
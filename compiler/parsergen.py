@@ -0,0 +1,55 @@
+"""
+Freezes the Fluorite grammar's LALR tables into 'compiler/_parsetab.py':
+
+    python -m compiler.parsergen
+
+Re-run it after changing any production or the precedence table - until
+then Parser() falls back to building (and caching) the tables at runtime.
+The output only depends on the grammar (see ParseTables.canonical()), so
+regenerating unchanged tables leaves the file as it is
+"""
+import os
+import textwrap
+import typing
+
+from .grammar import Grammar
+from .lrparser import ParseTables
+from .parser import Parser
+
+
+PARSETAB_MODULE = os.path.join(os.path.dirname(__file__), '_parsetab.py')
+
+
+def _format_rows(name: str, rows: typing.Sequence) -> str:
+    lines = [f"{name} = ("]
+    lines.extend(f"    {row!r}," for row in rows)
+    lines.append(")")
+
+    return '\n'.join(lines)
+
+
+def render(grammar: Grammar, tables: ParseTables) -> str:
+    return '\n\n'.join([
+        "# Generated by 'python -m compiler.parsergen' from the grammar in compiler/parser.py - DO NOT EDIT!",
+
+        f"GRAMMAR_HASH = {grammar.hash()!r}",
+
+        _format_rows("PRODUCTIONS", [tuple(prod) for prod in tables.productions]),
+        textwrap.fill(f"DEFAULT_REDUCTIONS = {tuple(tables.default_reductions)!r}",
+                      width=100, subsequent_indent=' '*4),
+
+        _format_rows("ACTION", tables.action),
+        _format_rows("GOTO", tables.goto),
+    ]) + '\n'
+
+
+def generate(path: str = PARSETAB_MODULE):
+    grammar = Parser.grammar()
+    tables = ParseTables.from_lr_table(grammar.generator().build().lr_table)
+
+    with open(path, 'w') as f:
+        f.write(render(grammar, tables))
+
+
+if __name__ == '__main__':
+    generate()
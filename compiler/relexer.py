@@ -0,0 +1,90 @@
+import rply
+from rply.token import SourcePosition
+
+import re
+import typing
+
+from .source import LineIndex, SourceBuffer
+
+
+Token = rply.token.Token
+
+
+class RegexLexer:
+    """
+    Lexer backend which compiles all the ignore and token rules into a single regex
+        alternation - so each token takes one re.match() instead of one per rule.
+
+    The ignore rules come first, followed by the token rules in declaration order, and
+        Python's alternation picks the first alternative that matches - the exact same
+        priority rply.lexer.Lexer gives them. Token values and SourcePositions (down to
+        the lineno/colno conventions) are identical to rply's - except that lines and
+        columns are only resolved when asked for, instead of tracked while lexing.
+
+    spans() also lexes UTF-8 encoded buffers (bytes, mmap) in place, through a bytes
+        version of the same regex - where offsets are byte offsets, and \\w, \\s and
+        \\d only match ASCII characters
+    """
+    _Rule = typing.Tuple[str, str]
+
+    __slots__ = ('_master', '_master_bytes', '_tags')
+    _master: typing.Pattern[str]
+    _master_bytes: typing.Pattern[bytes]
+    _tags: typing.List[typing.Optional[str]]    # group index -> TokenTag (None => ignored)
+
+    def __init__(self, rules: typing.Iterable[_Rule], ignore_rules: typing.Iterable[str]):
+        alternatives: typing.List[str] = []
+        tags: typing.List[typing.Optional[str]] = [None]      # group 0 is the whole match
+
+        for (tag, pattern) in [(None, pattern) for pattern in ignore_rules] + list(rules):
+            alternatives.append(f"({pattern})")
+
+            # Nested groups close before the rule's own, so Match.lastindex always
+            #   lands on the rule's group - the slots of the nested ones go unused
+            tags.append(tag)
+            tags.extend([None] * re.compile(pattern).groups)
+
+        self._master = re.compile('|'.join(alternatives))
+        self._master_bytes = re.compile(self._master.pattern.encode())
+        self._tags = tags
+
+    def lex(self, source: str) -> typing.Iterator[Token]:
+        lines = LineIndex(source)       # only built if a token's lineno/colno is ever looked at
+
+        for (tag, start, end) in self.spans(source):
+            yield Token(tag, source[start:end], lines.sourcepos(start))
+
+    def spans(self, source: SourceBuffer) -> typing.Iterator[typing.Tuple[str, int, int]]:
+        """
+        :return: an Iterator yielding a (tag, start, end) triple for each token - leaving
+             out the line/column tracking, which only lex() needs
+        """
+        match = (self._master if isinstance(source, str) else self._master_bytes).match
+        tags = self._tags
+
+        (idx, end) = (0, len(source))
+        tok_start = None
+
+        while idx < end:
+            m = match(source, idx)
+            if m is None:
+                raise rply.LexingError(None, RegexLexer.__error_pos(source, idx, tok_start))
+
+            (start, idx) = m.span()
+
+            tag = tags[m.lastindex]
+            if tag is not None:
+                tok_start = start
+
+                yield (tag, start, idx)
+
+    @staticmethod
+    def __error_pos(source: SourceBuffer, idx: int, tok_start: typing.Optional[int]) -> SourcePosition:
+        """
+        :return: the position rply reports in LexingErrors - the failing offset's
+             line, but the column of the last token lexed
+        """
+        lines = LineIndex(source)
+        colno = lines.position(tok_start)[1] if tok_start is not None else 1
+
+        return SourcePosition(idx, lines.lineno(idx), colno)
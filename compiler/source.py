@@ -0,0 +1,125 @@
+from rply.token import SourcePosition
+
+import os
+import mmap
+import contextlib
+import array
+import bisect
+import typing
+
+
+# Text, or a buffer of UTF-8 encoded text (which gets lexed in place)
+SourceBuffer = typing.Union[str, bytes, bytearray, mmap.mmap]
+
+# ...or the path of a source file, which is mapped into memory
+Source = typing.Union[SourceBuffer, os.PathLike]
+
+SOURCE_TYPES = (str, bytes, bytearray, mmap.mmap, os.PathLike)
+
+
+def open_source(source: Source) -> SourceBuffer:
+    """
+    :return: 'source' itself when it's text or a buffer already, or - when it's
+         a path - the file mapped read-only into memory (so it's never read
+         into, nor decoded to, a Python str as a whole)
+    """
+    if not isinstance(source, os.PathLike):
+        return source
+
+    with open(source, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:      # empty files can't be mapped
+            return b''
+
+
+@contextlib.contextmanager
+def opened_source(source: Source) -> typing.Iterator[SourceBuffer]:
+    """
+    open_source() as a context manager - which closes the file's mapping on exit, when
+        'source' is a path. Whatever still reads through to it (like the tokens lexed
+        from it) must be done with it by then
+    """
+    buffer = open_source(source)
+    try:
+        yield buffer
+    finally:
+        if buffer is not source and isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+
+def decode(text: typing.Union[str, bytes]) -> str:
+    return text if isinstance(text, str) else str(text, 'utf-8')
+
+
+class LineIndex:
+    """
+    The offsets at which each line of a source starts - built once, on the first lookup,
+        after which an offset's line and column are resolved by binary search. Lines
+        and columns are 1-based, following rply's conventions
+    """
+    __slots__ = ('_source', '_starts')
+    _source: typing.Optional[SourceBuffer]
+    _starts: typing.Optional[array.array]     # array('I') of line start offsets
+
+    def __init__(self, source: SourceBuffer):
+        self._source = source
+        self._starts = None
+
+    @property
+    def line_starts(self) -> array.array:
+        if self._starts is None:
+            self._starts = LineIndex.__build(self._source)
+            self._source = None                 # no longer needed...
+
+        return self._starts
+
+    def lineno(self, offset: int) -> int:
+        return bisect.bisect_right(self.line_starts, offset)
+
+    def position(self, offset: int) -> typing.Tuple[int, int]:
+        """
+        :return: the (lineno, colno) of the character at 'offset'
+        """
+        starts = self.line_starts
+        lineno = bisect.bisect_right(starts, offset)
+
+        return (lineno, offset - starts[lineno-1] + 1)
+
+    def sourcepos(self, offset: int) -> 'LazySourcePosition':
+        return LazySourcePosition(offset, self)
+
+    @staticmethod
+    def __build(source: SourceBuffer) -> array.array:
+        starts = array.array('I', [0])
+
+        (find, newline) = (source.find, '\n' if isinstance(source, str) else b'\n')
+
+        nl = find(newline)
+        while nl >= 0:
+            starts.append(nl + 1)
+            nl = find(newline, nl + 1)
+
+        return starts
+
+
+class LazySourcePosition(SourcePosition):
+    """
+    A SourcePosition which only holds the offset - its lineno and colno get looked
+        up in the source's LineIndex when (and if) someone asks for them
+    """
+    __slots__ = ('idx', '_lines')
+    idx: int
+    _lines: LineIndex
+
+    def __init__(self, idx: int, lines: LineIndex):
+        self.idx = idx
+        self._lines = lines
+
+    @property
+    def lineno(self) -> int:
+        return self._lines.lineno(self.idx)
+
+    @property
+    def colno(self) -> int:
+        return self._lines.position(self.idx)[1]
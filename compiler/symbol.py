@@ -1,18 +1,190 @@
+import ast
+import itertools
 import typing
 
+import py
+
 
 class Symbol:
-    __slots__ = ('_module', '_sym', )
-    _module: typing.Any
-    _sym: str
+    """
+    A variable - bound by a match in some scope, and accessed by the generated code through
+        its 'py_name' as either:
+        - a module-level variable (a global - it's one of the module's exports)
+        - a local of the function the code runs in
+        - a local of an enclosing function, captured by a closure
+    """
+    __slots__ = ('name', 'scope', 'kind', 'py_name')
+    name: str
+    scope: 'SymbolTable'
+    kind: str
+    py_name: str
+
+    MODULE   = 'module'
+    LOCAL    = 'local'
+    CAPTURED = 'captured'
+
+    def __init__(self, name: str, scope: 'SymbolTable'):
+        self.name = name
+        self.scope = scope
+        self.kind = Symbol.MODULE if scope.kind == SymbolTable.MODULE else Symbol.LOCAL
+        self.py_name = name
+
+    def __repr__(self):
+        return f"Symbol({self.name!r}, {self.kind}, py_name={self.py_name!r})"
 
-    def __init__(self):
-        self._module = None
-        self._sym = ':sym'
 
 class SymbolTable:
-    __slots__ = ('_syms', )
-    _syms: typing.Dict[int, Symbol]
+    """
+    The variables bound in a scope: the module's top level, a function, or a do block -
+        each do block being a scope of its own, nested in the one it's part of
+    """
+    __slots__ = ('_syms', 'kind', 'parent', 'children')
+    _syms: typing.Dict[str, Symbol]     # name -> the variable it's bound to in this scope
+    kind: str
+    parent: typing.Optional['SymbolTable']
+    children: typing.List['SymbolTable']
 
-    def __init__(self):
+    MODULE   = 'module'
+    FUNCTION = 'function'
+    BLOCK    = 'block'
+
+    def __init__(self, kind: str, parent: typing.Optional['SymbolTable'] = None):
         self._syms = {}
+        self.kind = kind
+        self.parent = parent
+        self.children = []
+
+        if parent is not None:
+            parent.children.append(self)
+
+    @property
+    def symbols(self) -> typing.Iterable[Symbol]:
+        return self._syms.values()
+
+    @property
+    def function(self) -> 'SymbolTable':
+        """
+        :return: the scope of the code the variables live in - the closest enclosing
+             function, or the module's top level
+        """
+        scope = self
+        while scope.kind == SymbolTable.BLOCK:
+            scope = scope.parent
+
+        return scope
+
+    def bind(self, name: str) -> Symbol:
+        """
+        :return: the variable 'name' is bound to in this scope - a new one, unless it's
+             being rebound
+        """
+        sym = self._syms.get(name)
+        if sym is None:
+            sym = self._syms[name] = Symbol(name, self)
+
+        return sym
+
+    def lookup(self, name: str) -> typing.Optional[Symbol]:
+        """
+        :return: the variable 'name' refers to here - bound in this scope or an enclosing one
+        """
+        scope = self
+        while scope is not None:
+            sym = scope._syms.get(name)
+            if sym is not None:
+                return sym
+
+            scope = scope.parent
+
+        return None
+
+    def walk(self) -> typing.Iterator['SymbolTable']:
+        """
+        :return: an Iterator over this scope and all the ones nested in it
+        """
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+class ScopeAnalyzer:
+    """
+    Resolves the variables of an IR tree: fills a SymbolTable per scope, and stamps every
+        py.Symbol - read or bound - with the Symbol it resolves to (as its 'binding').
+
+    Names are resolved in evaluation order - a read refers to the innermost variable of
+        its name bound so far, so a block's reads of a name it only binds later are of
+        the enclosing scope's variable. Reads of names nothing has bound (yet) are left
+        unresolved, for the generated code to look up among the module's globals and
+        the builtins.
+
+    The locals of a function are then given Python names: their own, unless it's also
+        a module-level name, or one read unresolved, in which case they're renamed
+    """
+    __slots__ = ('_unresolved', )
+    _unresolved: typing.Dict[int, typing.Set[str]]      # id() of a function scope -> names read unresolved in it
+
+    __WILDCARD = '_'
+    __RENAMED = '{}__fl_{}'
+
+    def __init__(self):
+        self._unresolved = {}
+
+    def analyze(self, unit: py.CompilationUnit) -> SymbolTable:
+        """
+        :return: the module's SymbolTable - the root of the tree of its scopes
+        """
+        module = SymbolTable(SymbolTable.MODULE)
+
+        for node in unit.body:
+            self.__resolve(node, module)
+
+        self.__name_locals(module)
+
+        return module
+
+    def __resolve(self, node: ast.AST, scope: SymbolTable):
+        if isinstance(node, py.Symbol):
+            sym = scope.lookup(node.name)
+            if sym is None:
+                self._unresolved.setdefault(id(scope.function), set()).add(node.name)
+            elif sym.kind != Symbol.MODULE and sym.scope.function is not scope.function:
+                sym.kind = Symbol.CAPTURED
+
+            node.binding = sym
+
+        elif isinstance(node, py.Match):
+            self.__resolve(node.bind.pattern, scope)    # the bound value comes first
+
+            for binder in ast.walk(node.target.pattern):
+                if isinstance(binder, py.Symbol) and binder.name != ScopeAnalyzer.__WILDCARD:
+                    binder.binding = scope.bind(binder.name)
+
+        elif isinstance(node, py.Do):
+            block = SymbolTable(SymbolTable.BLOCK, scope)
+
+            for expr in node.body:
+                self.__resolve(expr, block)
+
+        else:
+            for child in ast.iter_child_nodes(node):
+                self.__resolve(child, scope)
+
+    def __name_locals(self, module: SymbolTable):
+        module_names = {sym.name for sym in module.symbols}
+        taken: typing.Dict[int, typing.Set[str]] = {}     # id() of a function scope -> the Python names used in it
+        counter = itertools.count()
+
+        for scope in module.walk():
+            function = id(scope.function)
+            if function not in taken:
+                taken[function] = module_names | self._unresolved.get(function, set())
+
+            for sym in scope.symbols:
+                if sym.kind == Symbol.MODULE:
+                    continue
+
+                if sym.name in taken[function]:
+                    sym.py_name = ScopeAnalyzer.__RENAMED.format(sym.name, next(counter))
+
+                taken[function].add(sym.py_name)
@@ -0,0 +1,85 @@
+import contextlib
+import os
+import json
+import tempfile
+import typing
+
+from .grammar import Grammar
+from .lrparser import ParseTables
+
+
+class ParseTableCache:
+    """
+    On-disk cache of the LALR tables generated for a Grammar, keyed by Grammar.hash() -
+        so any change to the grammar lands on a different cache file
+    """
+    VERSION = 2
+
+    __slots__ = ('_dir', )
+    _dir: str
+
+    def __init__(self, cache_dir: typing.Optional[str] = None):
+        self._dir = cache_dir if cache_dir is not None else ParseTableCache.default_dir()
+
+    @property
+    def cache_dir(self) -> str:
+        return self._dir
+
+    @staticmethod
+    def default_dir() -> str:
+        """
+        :return: $FLUORITE_CACHE_DIR when set, otherwise 'fluorite' under the
+             user's XDG cache directory
+        """
+        cache_dir = os.environ.get('FLUORITE_CACHE_DIR')
+        if cache_dir:
+            return cache_dir
+
+        xdg_cache = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+
+        return os.path.join(xdg_cache, 'fluorite')
+
+    def cache_file(self, grammar_hash: str) -> str:
+        return os.path.join(self._dir, f"parsetab-{ParseTableCache.VERSION}-{grammar_hash}.json")
+
+    def tables(self, grammar: Grammar) -> ParseTables:
+        """
+        :return: the cached tables for 'grammar', only running rply's (expensive)
+             LALR construction when no valid ones are found
+        """
+        cache_file = self.cache_file(grammar.hash())
+
+        tables = ParseTableCache.__load(cache_file)
+        if tables is not None and len(tables.productions) == len(grammar.funcs):
+            return tables
+
+        tables = ParseTables.from_lr_table(grammar.generator().build().lr_table)
+        self.__store(cache_file, tables)
+
+        return tables
+
+    @staticmethod
+    def __load(cache_file: str) -> typing.Optional[ParseTables]:
+        try:
+            with open(cache_file) as f:
+                return ParseTables.deserialize(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):     # missing, unreadable or corrupt - rebuild it
+            return None
+
+    def __store(self, cache_file: str, tables: ParseTables):
+        tmp_file = None
+        try:
+            os.makedirs(self._dir, mode=0o700, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile('w', dir=self._dir, delete=False) as f:
+                tmp_file = f.name
+                json.dump(tables.serialize(), f)
+
+            os.replace(tmp_file, cache_file)    # atomic, so concurrent builds never see a partial file
+            tmp_file = None
+        except OSError:                         # read-only/unwritable cache dir - just go without
+            return
+        finally:
+            if tmp_file is not None:            # ...failed halfway - don't leave the partial file behind
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_file)
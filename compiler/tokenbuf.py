@@ -0,0 +1,137 @@
+import rply
+from rply.token import SourcePosition
+
+import array
+import itertools
+import typing
+
+from .source import LineIndex, SourceBuffer, decode
+
+
+class TokenBuffer:
+    """
+    A whole token stream stored struct-of-arrays style: a tag id, start offset and
+        length per token, with the text only sliced out of the source on demand.
+        That's 9 bytes per token, instead of an rply Token + SourcePosition + str.
+
+    Synthetic tokens (FNAPPLY, and LFs whose matched whitespace was blanked out) are
+        stored with a zero length - a token actually matched in the source never is.
+
+    The source can also be a UTF-8 encoded buffer (bytes, mmap), in which case offsets
+        are in bytes and token text is only decoded when it's read
+    """
+    __slots__ = ('_source', '_tag_names', '_lines', 'tags', 'starts', 'lengths')
+    _source: SourceBuffer
+    _tag_names: typing.Sequence[str]   # tag id -> TokenTag
+    _lines: LineIndex
+
+    tags: array.array       # array('B') of tag ids
+    starts: array.array     # array('I') of offsets into the source
+    lengths: array.array    # array('I')
+
+    def __init__(self, source: SourceBuffer, tag_names: typing.Sequence[str]):
+        assert len(tag_names) <= 256, 'tag ids must fit in a byte!'
+
+        self._source = source
+        self._tag_names = tag_names
+        self._lines = LineIndex(source)
+
+        self.tags = array.array('B')
+        self.starts = array.array('I')
+        self.lengths = array.array('I')
+
+    def __len__(self):
+        return len(self.tags)
+
+    def __iter__(self) -> typing.Iterator['TokenView']:
+        return map(TokenView, itertools.repeat(self), range(len(self)))
+
+    def __getitem__(self, idx: int) -> 'TokenView':
+        return TokenView(self, range(len(self))[idx])
+
+    @property
+    def source(self) -> SourceBuffer:
+        return self._source
+
+    @property
+    def lines(self) -> LineIndex:
+        return self._lines
+
+    def append(self, tag_id: int, start: int, length: int):
+        self.tags.append(tag_id)
+        self.starts.append(start)
+        self.lengths.append(length)
+
+    def tag(self, idx: int) -> str:
+        return self._tag_names[self.tags[idx]]
+
+    def text(self, idx: int) -> str:
+        start = self.starts[idx]
+
+        return decode(self._source[start:start+self.lengths[idx]])
+
+    def sourcepos(self, idx: int) -> typing.Optional[SourcePosition]:
+        """
+        :return: the token's position, with rply's lineno/colno conventions - or None for
+             synthetic tokens, just like the ones inserted into Lexer.lex()'s stream
+        """
+        if not self.lengths[idx]:
+            return None
+
+        return self._lines.sourcepos(self.starts[idx])
+
+    def offset(self, idx: int) -> int:
+        return self.starts[idx]
+
+    def memory_size(self) -> int:
+        """
+        :return: the size (in bytes) of the token arrays, the source itself not included
+        """
+        return sum(arr.buffer_info()[1] * arr.itemsize for arr in (self.tags, self.starts, self.lengths))
+
+
+class TokenView:
+    """
+    Stand-in for an rply.token.Token, reading its tag/text/position through to a TokenBuffer -
+        cheap enough to create on the fly while the parser consumes the buffer
+    """
+    __slots__ = ('_buf', '_idx')
+    _buf: TokenBuffer
+    _idx: int
+
+    def __init__(self, buf: TokenBuffer, idx: int):
+        self._buf = buf
+        self._idx = idx
+
+    @property
+    def name(self) -> str:
+        return self._buf.tag(self._idx)
+
+    @property
+    def value(self) -> str:
+        return self._buf.text(self._idx)
+
+    @property
+    def source_pos(self) -> typing.Optional[SourcePosition]:
+        return self._buf.sourcepos(self._idx)
+
+    def gettokentype(self) -> str:
+        return self.name
+
+    def getstr(self) -> str:
+        return self.value
+
+    def getsourcepos(self) -> typing.Optional[SourcePosition]:
+        return self.source_pos
+
+    def __eq__(self, other):
+        if not isinstance(other, (TokenView, rply.token.Token)):
+            return NotImplemented
+
+        return self.name == other.name and self.value == other.value
+
+    def __hash__(self):
+        return hash((self.name, self.value))
+
+    def __repr__(self):
+        return f"Token({self.name!r}, {self.value!r})"
@@ -4,10 +4,13 @@ import typing
 
 from py.compileunit import CompilationUnit
 
+from .arena import TreeArena
+
 class ParseTreesData:
-    __slots__ = ('_src_tree', '_ir_tree', '_py_tree')
+    __slots__ = ('_src_tree', '_src_arena', '_ir_tree', '_py_tree')
     _src_tree: typing.Optional[CompilationUnit]    # The syntax tree generated by the parser.Parser
                                            #   from fluorite sources
+    _src_arena: typing.Optional[TreeArena] # '_src_tree', once compact()'ed
     _ir_tree: typing.Optional[ast.AST]     # '_src_tree' transformed by codetransform.IRTransformer
 
     _py_tree: typing.Optional[ast.Module]  # The final syntax tree generated from '_ir_tree',
@@ -16,11 +19,19 @@ class ParseTreesData:
 
     def __init__(self):
         self._src_tree = None
+        self._src_arena = None
         self._ir_tree = None
         self._py_tree = None
 
     @property
     def source_tree(self) -> CompilationUnit:
+        """
+        :return: the source tree - rebuilt from its arena when compact(), a new tree on
+             every access
+        """
+        if self._src_arena is not None:
+            return typing.cast(CompilationUnit, self._src_arena.to_tree())
+
         assert self._src_tree is not None, 'attempted to get tree from empty ParseTreesData!'
 
         return typing.cast(CompilationUnit, self._src_tree)
@@ -28,19 +39,58 @@ class ParseTreesData:
     @source_tree.setter
     def source_tree(self, nodes: typing.Iterable[ast.stmt]):
         self._src_tree = CompilationUnit(body=list(nodes))
+        self._src_arena = None
 
-    def _unparse_source_tree(self):
-        assert self._src_tree is not None
+    def compact(self) -> TreeArena:
+        """
+        Swaps the source tree for its TreeArena - for holding on to the trees of many
+            sources, at a fraction of the memory. Only the source tree is: the others are
+            the passes' to mutate, and are dropped
+
+        :return: the source tree's arena
+        """
+        if self._src_arena is None:
+            self._src_arena = TreeArena.from_tree(self.source_tree)
+            self._src_tree = None
+
+        self._ir_tree = None
+        self._py_tree = None
+
+        return self._src_arena
+
+    @property
+    def ir_tree(self) -> ast.AST:
+        assert self._ir_tree is not None, 'attempted to get IR tree before it was transformed!'
 
-        src = ast.unparse(self._src_tree.ast_mod)
+        return self._ir_tree
+
+    @ir_tree.setter
+    def ir_tree(self, tree: ast.AST):
+        self._ir_tree = tree
+
+    @property
+    def py_tree(self) -> ast.Module:
+        assert self._py_tree is not None, 'attempted to get Python tree before it was generated!'
+
+        return self._py_tree
+
+    @py_tree.setter
+    def py_tree(self, module: ast.Module):
+        self._py_tree = module
+
+    def _unparse_source_tree(self):
+        src = ast.unparse(self.source_tree.ast_mod)
         src = src.strip()
 
         fold_newlines = re.compile(r"\n{2,}", re.MULTILINE|re.DOTALL)
 
         return re.sub(fold_newlines, "\n", src)
 
-    def _dump_source_tree(self):
-        assert self._src_tree is not None
+    def _unparse_py_tree(self):
+        assert self._py_tree is not None
 
-        return ast.dump(self._src_tree,
+        return ast.unparse(self._py_tree)
+
+    def _dump_source_tree(self):
+        return ast.dump(self.source_tree,
                         annotate_fields=False, include_attributes=False, indent=2)
@@ -1,17 +1,19 @@
 from fluorite import    \
-    module,             \
+    module, function,   \
     value,              \
-    atom, number
+    atom, number,       \
+    runtime
 
 
-Module = module.Module
+Module   = module.Module
+Function = function.Function
 
-Value  = value.Value
-Atom   = atom.Atom
-Number = number.Integer
+Value    = value.Value
+Atom     = atom.Atom
+Number   = number.Integer
 
 __all__ = [
-    module.Module,
+    module.Module, function.Function,
 
     value.Value,
     atom.Atom, number.Integer,
@@ -1,22 +1,56 @@
 import xxhash
 
+import typing
+
 from .value import Value
 
 
 class Atom(Value):
+    """
+    Atoms are interned - Atom(*path) returns the one Atom object there is for each name,
+        its xxh64 id computed only when it's first created. Equal atoms are thus always
+        identical, so comparing them is an identity check and hashing one is free
+    """
     __slots__ = ('_name', '_id')
     _name: str
     _id: int
 
-    def __init__(self, *path: str):
+    __interned: typing.Dict[str, 'Atom'] = {}     # name -> Atom, process-wide
+
+    def __new__(cls, *path: str):
         name = '.'.join(path)
 
-        h = xxhash.xxh64()
-        h.update(self._name)
+        atom = Atom.__interned.get(name)
+        if atom is None:
+            atom = super().__new__(cls)
+            atom._name = name
+            atom._id = xxhash.xxh64_intdigest(name.encode())
+
+            atom = Atom.__interned.setdefault(name, atom)     # another thread may have beaten us to it
 
-        self._name = name
-        self._id = h.intdigest()
+        return atom
+
+    @classmethod
+    def interned(cls, names: typing.Iterable[str]) -> typing.Tuple['Atom', ...]:
+        """
+        :return: the Atoms for all of 'names' - meant for interning a module's atom
+             constants up front, when it's loaded
+        """
+        return tuple(map(cls, names))
 
     @property
     def name(self) -> str:
         return self._name
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    def __hash__(self):
+        return self._id
+
+    def __reduce__(self):
+        return (Atom, (self._name, ))       # re-intern when unpickled/copied
+
+    def __repr__(self):
+        return f"Atom({self._name!r})"
@@ -5,12 +5,21 @@ from .atom import Atom
 
 
 class Function:
+    """
+    A Fluorite function - one 'Module.fun/arity' of a Module's dispatch table.
+
+    Its code object takes the function's arity positional arguments, as they are: no
+        packing into tuples, and a keyword list - passed last - is just a list of {atom,
+        value} tuples, only turned into a _KwargsPack for the code objects asking for
+        one (see packed()). Calls linked to the function call its code object directly
+    """
     _ArgsPack = typing.Tuple[Value, ...]
 
-    _KeywordArg = typing.Tuple[Atom, Value
-    _KwargsPack = typing.Tuple[KeywordArg, ...]
+    _KeywordArg = typing.Tuple[Atom, Value]
+    _KwargsPack = typing.Tuple[_KeywordArg, ...]
 
-    FnCodeObject = typing.Callable[[_ArgsPack, _KwargsPack], Value]
+    FnCodeObject = typing.Callable[..., Value]
+    PackedCodeObject = typing.Callable[[_ArgsPack, _KwargsPack], Value]
 
     __slots__ = ("_module", "_symbol", "_arity", "_co")
     _module: Atom
@@ -23,10 +32,46 @@ class Function:
         self._symbol = symbol
         self._module = module
         self._arity = arity
+        self._co = fn_codeobj
+
+    @classmethod
+    def packed(cls, symbol: Atom, fn_codeobj: PackedCodeObject, *,
+                    module: Atom, arity: int, keywords: bool = False) -> 'Function':
+        """
+        :return: a Function whose code object takes its arguments packed - with its keyword
+             list (its last argument, when it takes 'keywords') as a _KwargsPack
+        """
+        if keywords:
+            def code(*args: Value) -> Value:
+                return fn_codeobj(args[:-1], tuple(args[-1]))
+        else:
+            def code(*args: Value) -> Value:
+                return fn_codeobj(args, ())
+
+        return cls(symbol, code, module=module, arity=arity)
+
+    @property
+    def symbol(self) -> Atom:
+        return self._symbol
+
+    @property
+    def module(self) -> Atom:
+        return self._module
+
+    @property
+    def arity(self) -> int:
+        return self._arity
 
     @property
-    def qual_name(self):
-        return '.'.join((self._module, self._symbol))
+    def code(self) -> FnCodeObject:
+        return self._co
+
+    @property
+    def qual_name(self) -> str:
+        return '.'.join((self._module.name, self._symbol.name))
+
+    def __call__(self, *args: Value) -> Value:
+        return self._co(*args)
 
     def __repr__(self):
         return f"{self.qual_name}/{self._arity}"
@@ -1,17 +1,59 @@
 import typing
 
-from .value import Value
 from .atom import Atom
+from .function import Function
 
 
 class Module:
+    """
+    A Fluorite module - its functions, in a dispatch table keyed by (atom id, arity), so
+        'Module.fun/arity' is found with a single dict lookup.
+
+    Calls into a module are linked to the functions they resolve to, once (see
+        fluorite.runtime.FunctionRef) - a module is redefined by registering a new one
+        under its name, or a function of a registered one by defining it again, both of
+        which invalidate them
+    """
     __slots__ = ('_name', '_fns')
     _name: Atom
-    _fns: typing.Mapping[int, typing.Callable]
+    _fns: typing.Dict[typing.Tuple[int, int], Function]     # (symbol id, arity) -> Function
 
-    def __init__(self, name):
+    def __init__(self, name: Atom, fns: typing.Iterable[Function] = ()):
         self._name = name
+        self._fns = {}
+
+        for fn in fns:
+            self.define(fn)
+
+    @property
+    def name(self) -> Atom:
+        return self._name
 
     @property
     def pretty_name(self) -> str:
         return self._name.name
+
+    @property
+    def functions(self) -> typing.Iterable[Function]:
+        return self._fns.values()
+
+    def define(self, fn: Function):
+        key = (fn.symbol.id, fn.arity)
+        redefined = key in self._fns
+
+        self._fns[key] = fn
+
+        if redefined:
+            from . import runtime       # ...which imports this module
+
+            if runtime.registered(self.pretty_name) is self:
+                runtime.invalidate(self.pretty_name)
+
+    def function(self, symbol: Atom, arity: int) -> typing.Optional[Function]:
+        """
+        :return: 'symbol'/'arity' - or None, when the module doesn't define it
+        """
+        return self._fns.get((symbol.id, arity))
+
+    def __repr__(self):
+        return f"Module({self.pretty_name!r})"
@@ -0,0 +1,149 @@
+"""
+Support code for compiled Fluorite modules - imported by every one of them as '__fl_rt'
+"""
+import importlib
+import typing
+import weakref
+
+from .atom import Atom
+from .function import Function
+from .module import Module
+
+
+class MatchError(Exception):
+    """ Raised when the value bound in a match doesn't fit its pattern """
+    def __init__(self, value: typing.Any):
+        self.value = value
+
+        super().__init__(f"no match of right hand side value: {value!r}")
+
+
+class UndefinedFunctionError(Exception):
+    def __init__(self, module: str, name: str, arity: int):
+        self.module = module
+        self.name = name
+        self.arity = arity
+
+        super().__init__(f"function {module}.{name}/{arity} is undefined (or private)")
+
+
+# Fluorite module name -> Module, or namespace holding its functions as attributes
+_modules: typing.Dict[str, typing.Any] = {}
+
+# Fluorite module name -> the FunctionRefs which resolved into it - held weakly, as they
+#   live as long as the globals they're linked in (see link())
+_linked: typing.Dict[str, 'weakref.WeakSet[FunctionRef]'] = {}
+
+# Where link() keeps a module's FunctionRefs, in its globals
+LINKS = '__fl_links__'
+
+
+class FunctionRef:
+    """
+    Stands in for a qualified function ('Math.sqrt/1') in the globals of a module calling it,
+        until it's first called: it then resolves the function, and replaces itself with it -
+        with a Function's code object, that is - so every later call is a plain global load.
+        The global is thus a monomorphic inline cache, shared by the module's calls to the
+        function: when the function's module is reloaded (or re-registered) the FunctionRef
+        is put back in its place, see invalidate()
+    """
+    __slots__ = ('_globals', '_var', '_module', '_name', '_arity', '__weakref__')
+    _globals: typing.Dict[str, typing.Any]      # ...of the calling module
+    _var: str                                   # the name it's bound to in there
+
+    def __init__(self, _globals: typing.Dict[str, typing.Any], var: str, module: str, name: str, arity: int):
+        self._globals = _globals
+        self._var = var
+        self._module = module
+        self._name = name
+        self._arity = arity
+
+    def __call__(self, *args, **kwargs):
+        fn = resolve(self._module, self._name, self._arity)
+        if isinstance(fn, Function):
+            fn = fn.code
+
+        self._globals[self._var] = fn
+        _linked.setdefault(self._module, weakref.WeakSet()).add(self)
+
+        return fn(*args, **kwargs)
+
+    def unlink(self):
+        self._globals[self._var] = self
+
+    def __repr__(self):
+        return f"FunctionRef({self._module}.{self._name}/{self._arity})"
+
+
+def link(_globals: typing.Dict[str, typing.Any], refs: typing.Iterable[typing.Tuple[str, str, str, int]]):
+    """
+    Binds each (var, module, name, arity) of 'refs' in '_globals' to a FunctionRef -
+        called by a compiled module's prologue, with its own globals. The FunctionRefs
+        are also kept in there, under LINKS: once linked, it's all that holds on to them,
+        so they go away along with the globals - and, with them, from invalidate()'s
+        registry
+    """
+    links = _globals[LINKS] = []        # ...dropping those of an earlier run in the same globals
+
+    for (var, module, name, arity) in refs:
+        ref = _globals[var] = FunctionRef(_globals, var, module, name, arity)
+        links.append(ref)
+
+
+def invalidate(module: str):
+    """
+    Makes the calls into 'module' resolve its functions again - to be called whenever
+        they change (as register_module() and compiler.importer's loader do)
+    """
+    for ref in _linked.pop(module, ()):
+        ref.unlink()
+
+
+def register_module(name: str, namespace: typing.Any):
+    """
+    Makes the functions of 'namespace' - a Module, or any object holding them as attributes
+        (a Python module, a SimpleNamespace...) - callable from Fluorite as '<name>.<function>',
+        replacing whatever was registered under 'name' before
+    """
+    _modules[name] = namespace
+
+    invalidate(name)
+
+
+def registered(name: str) -> typing.Optional[typing.Any]:
+    """
+    :return: what's registered under 'name' - None when nothing is (yet)
+    """
+    return _modules.get(name)
+
+
+def resolve(module: str, name: str, arity: int) -> typing.Callable:
+    """
+    :return: the function a qualified call like 'Math.sqrt/1' refers to - looked up in the
+         dispatch table of a Module, or by name alone in any other namespace. The first call
+         into a module that hasn't been registered imports it (e.g. Foo/Bar.fl for
+         'Foo.Bar', once compiler.importer is installed), so modules are only ever
+         loaded when they're used
+    """
+    namespace = _modules.get(module)
+    if namespace is None:
+        namespace = _import_module(module)
+
+    if isinstance(namespace, Module):
+        fn = namespace.function(Atom(name), arity)
+    else:
+        fn = getattr(namespace, name, None) if namespace is not None else None
+
+    if fn is None:
+        raise UndefinedFunctionError(module, name, arity)
+
+    return fn
+
+
+def _import_module(module: str) -> typing.Optional[typing.Any]:
+    try:
+        namespace = importlib.import_module(module)
+    except ImportError:
+        return None
+
+    return _modules.setdefault(module, namespace)
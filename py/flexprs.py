@@ -9,6 +9,8 @@ from .fltypes import FlAtom
 class sym(ast.expr):
     __slots__ = ()
 
+    offset: typing.Optional[int] = None     # into the source, set by the parser
+
     def __init__(self, *args, **kwargs):
         super().__init__(args=args, kwargs=kwargs)
 
@@ -17,6 +19,8 @@ class Symbol(sym):
     """ Symbol(sym symbol) """
     __slots__ =  ('symbol', )
 
+    binding: typing.Any = None      # the variable it resolves to, set by compiler.symbol.ScopeAnalyzer
+
     def __init__(self, symbol, *args, **kwargs):
         self.symbol = symbol
 
@@ -92,90 +96,72 @@ class Do(ast.stmt):
     _AnyExpr = typing.Union[ast.expr, ast.Expr]
     _ExprSeq = typing.Iterable[_AnyExpr]
 
-    __slots__ = ('_blockbody', '_tail_expr')
+    __slots__ = ('_blockbody', )
 
     # For INTERNAL use only!
-    _blockbody: typing.Iterator[_AnyExpr]
-    _tail_expr: typing.Optional[ast.expr]
+    _blockbody: typing.List[_AnyExpr]     # all the block's expressions, the tail being the last one
+
+    offset: typing.Optional[int] = None     # of the 'do', set by the parser
 
     __map_expr_stmt = functools.partial(map, lambda e: ast.Expr(e) if isinstance(e, ast.expr) else e)
 
     def __init__(self, *, exprs: _ExprSeq = (), tail_expr: _AnyExpr = None, **kwargs):
-        self._blockbody = itertools.chain(exprs)
-        self._tail_expr = tail_expr
+        """
+        :param exprs: the block's expressions - the last one becoming its tail,
+                unless 'tail_expr' is given (and isn't exprs[-1] already)
+        """
+        self._blockbody = list(exprs)
 
-        self.__chain_expr_to_exprs(tail_expr)
+        if tail_expr is not None and (not self._blockbody or self._blockbody[-1] is not tail_expr):
+            self._blockbody.append(tail_expr)
 
         super().__init__(kwargs=kwargs)
 
+    @property
+    def body(self) -> typing.List[_AnyExpr]:
+        """
+        :return: the list backing the block - all its expressions, the tail included
+        """
+        return self._blockbody
+
     @property
     def exprs(self) -> typing.Iterable[ast.Expr]:
         """
         :return: An Iterable yielding all the Do block's expressions (including the tail)
         """
-        return self.__map_expr_stmt(self._tee_exprs())
+        return self.__map_expr_stmt(self._blockbody)
 
     @property
     def exprs_head(self) -> typing.Iterable[ast.Expr]:
         """
         :return: Same as 'Do.exprs' except only the head (i.e. all but the tail) exprs are yielded
         """
-        head: typing.Iterable[Do._AnyExpr] = ()
-        if self._tail_expr is not None:     # explicit tail is present
-            head = itertools.takewhile(lambda e: e is not self._tail_expr, self._tee_exprs())
-        else:                               # no explicit tail - drop _blockbody[-1]
-            (expr, successor) = itertools.tee(self._tee_exprs())
-            next(successor, None)     # need exprs pair-wise, but mustn't consume _blockbody
-
-            pairwise_head = itertools.takewhile(lambda args: None not in args, zip(expr, successor))
-            head = itertools.starmap(lambda e, _: e, pairwise_head)       # drop zipped-in successor
+        head = itertools.islice(self._blockbody, max(len(self._blockbody) - 1, 0))
 
         return self.__map_expr_stmt(head)
 
     @property
-    def tail_expr(self) -> ast.Expr:
+    def tail_expr(self) -> ast.stmt:
         """
-        :return: either the expression specified in __init__(..., tail=<ast.expr>) or appended via Do.append(...);
-             or an ast.Constant(None) => 'None' when it's not
+        :return: the block's last expression - the one it evaluates to - or
+             an ast.Constant(None) => 'None' for an empty block
         """
+        val = self._blockbody[-1] if self._blockbody else ast.Constant(None)
 
-        val = self._tail_expr if self._tail_expr is not None else ast.Constant(None)
-        expr: ast.Expr = ast.Expr(value=val) if val is not isinstance(val, ast.Expr) else val
-
-        return expr
+        return ast.Expr(value=val) if isinstance(val, ast.expr) else val
 
     def append(self, tail: ast.expr):
         """
         :param tail: the expression to be added at the tail of the block, while moving the previous
                 tail to the back of the body's expr list head (if one was set)
         """
-        if self._tail_expr is None:
-            self._tail_expr = tail
-        else:            # current tail must be preserved
-            self.__chain_expr_to_exprs(self._tail_expr)
-            self._tail_expr = tail
-
-        self.__chain_expr_to_exprs(tail)
+        self._blockbody.append(tail)
 
         return self
 
-    def __chain_expr_to_exprs(self, expr: _AnyExpr):
-        """
-        :param expr: Extends internal '_blockbody' itertools.chain
-        """
-        self._blockbody = itertools.chain(self._blockbody, (expr, ))
-
-        return self
-
-    def _tee_exprs(self):
-        (blockbody, exprs) = itertools.tee(self._blockbody)
-        self._blockbody = blockbody
-
-        return exprs
-
     @property
-    def _dump_exprs(self) -> typing.List[ast.Expr]:
-        return [expr for expr in map(lambda _: _, self._tee_exprs())]
+    def _dump_exprs(self) -> typing.List[_AnyExpr]:
+        return self._blockbody      # the list itself, so ast.NodeTransformer edits it in place
 
     _fields = (
         "_dump_exprs",
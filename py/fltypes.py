@@ -18,6 +18,8 @@ class FlTerm(ast.expr):
     __slots__ = ('value', )
     value: Term
 
+    offset: typing.Optional[int] = None     # into the source, set by the parser
+
     def __init__(self, *args, value: Term = None, **kwargs):
         self.value = value
 
@@ -80,6 +82,6 @@ class FlList(FlCollection):
     __slots__ = ()
 
 
-class FlTuple(FlTerm):
+class FlTuple(FlCollection):
     """ FlTuple(tuple value) """
     __slots__ = ()